@@ -0,0 +1,28 @@
+"""Benchmarks of the native_shortuuid hot paths.
+
+Every module exposes a ``run()`` function returning its results as a dict and
+can be run on its own, e.g. ``python -m benchmarks.from_db_value20``, or
+together with the others through ``runbenchmarks.py``.
+"""
+import os
+import timeit
+
+import django
+
+_database_created = False
+
+
+def setup():
+    """Configure Django with the tests settings and create the test database."""
+    global _database_created
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.test_settings')
+    django.setup()
+    if not _database_created:
+        from django.db import connection
+        connection.creation.create_test_db(verbosity=0)
+        _database_created = True
+
+
+def measure(function, number, repeat=5):
+    """Return the best time of ``function`` in nanoseconds per each of its ``number`` operations."""
+    return round(min(timeit.repeat(function, repeat=repeat, number=1)) / number * 1e9, 1)
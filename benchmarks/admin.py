@@ -0,0 +1,41 @@
+"""NativeUUIDSearchMixin searches on a 100k rows table."""
+import json
+
+from . import measure
+from . import setup
+
+ROWS = 100000
+SEARCHES = 200
+
+
+def run():
+    from django.contrib import admin
+    from django.test import RequestFactory
+
+    from native_shortuuid.admin import NativeUUIDSearchMixin
+    from native_shortuuid.fields import short_uuid4
+    from tests.models import ShortUUIDModel
+
+    class ShortUUIDModelAdmin(NativeUUIDSearchMixin, admin.ModelAdmin):
+        search_fields = ('field', )
+
+    ShortUUIDModel.objects.all().delete()
+    ShortUUIDModel.objects.bulk_create([ShortUUIDModel(field=short_uuid4()) for _ in range(ROWS)], batch_size=5000)
+    model_admin = ShortUUIDModelAdmin(ShortUUIDModel, admin.site)
+    request = RequestFactory().get('/')
+    terms = [short_uuid4() for _ in range(SEARCHES)]
+
+    def search():
+        for term in terms:
+            model_admin.get_search_fields(request)
+            queryset, _ = model_admin.get_search_results(request, ShortUUIDModel.objects.all(), term)
+            list(queryset)
+
+    results = {'get_search_results_ns': measure(search, SEARCHES, repeat=3)}
+    ShortUUIDModel.objects.all().delete()
+    return results
+
+
+if __name__ == '__main__':
+    setup()
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,36 @@
+"""Cost of a single encode/decode, against the shortuuid package, and of the batch conversions."""
+import json
+import uuid
+
+from . import measure
+from . import setup
+
+NUMBER = 20000
+
+
+def run():
+    import native_shortuuid
+    import shortuuid
+    from native_shortuuid import codec
+
+    values = [uuid.uuid4() for _ in range(NUMBER)]
+    strings = [codec.encode(value) for value in values]
+    data = [value.bytes for value in values]
+    numbers = [value.int for value in values]
+    return {
+        'encode_ns': measure(lambda: [codec.encode(value) for value in values], NUMBER),
+        'shortuuid_encode_ns': measure(lambda: [shortuuid.encode(value) for value in values], NUMBER),
+        'encode_many_ns': measure(lambda: native_shortuuid.encode_many(values), NUMBER),
+        'decode_ns': measure(lambda: [native_shortuuid.decode(string) for string in strings], NUMBER),
+        'shortuuid_decode_ns': measure(lambda: [shortuuid.decode(string) for string in strings], NUMBER),
+        'decode_many_ns': measure(lambda: native_shortuuid.decode_many(strings), NUMBER),
+        'bytes_to_string_ns': measure(lambda: [codec.bytes_to_string(item) for item in data], NUMBER),
+        'uuid_init_ns': measure(lambda: [uuid.UUID(int=number) for number in numbers], NUMBER),
+        'uuid_from_int_ns': measure(lambda: [codec.uuid_from_int(number) for number in numbers], NUMBER),
+        'is_valid_ns': measure(lambda: [native_shortuuid.is_valid(string) for string in strings], NUMBER),
+    }
+
+
+if __name__ == '__main__':
+    setup()
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,45 @@
+"""Per row cost of the 20 chars encoding on tables with legacy 22 chars rows.
+
+``encode20_ns`` (single pass) and ``two_pass_ns`` compare the encodings alone,
+``from_db_value_ns`` adds the cache lookup and the ShortUUIDString of the field.
+"""
+import json
+import uuid
+
+from . import measure
+from . import setup
+
+ROWS = 20000
+LEGACY_PERCENTAGES = (0, 50, 100, )
+
+
+def two_pass_from_db_value(value):
+    # The previous implementation, encoding the legacy values twice.
+    from native_shortuuid import codec
+    shortuuid_value = codec.encode(value, pad_length=20)
+    if len(shortuuid_value) > 20:
+        shortuuid_value = codec.encode(value, pad_length=22)
+    return shortuuid_value
+
+
+def run():
+    from native_shortuuid import NativeShortUUID20Field
+    from native_shortuuid import codec
+    from native_shortuuid import uuid4_12bits_masked
+
+    field = NativeShortUUID20Field()
+    results = {}
+    for percentage in LEGACY_PERCENTAGES:
+        legacy_rows = ROWS * percentage // 100
+        rows = [uuid.uuid4() for _ in range(legacy_rows)] + [uuid4_12bits_masked() for _ in range(ROWS - legacy_rows)]
+        results[f'{percentage}%_legacy'] = {
+            'encode20_ns': measure(lambda: [codec.encode20(row) for row in rows], ROWS),
+            'two_pass_ns': measure(lambda: [two_pass_from_db_value(row) for row in rows], ROWS),
+            'from_db_value_ns': measure(lambda: [field.from_db_value(row, None, None) for row in rows], ROWS),
+        }
+    return results
+
+
+if __name__ == '__main__':
+    setup()
+    print(json.dumps(run(), indent=2))
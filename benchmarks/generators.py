@@ -0,0 +1,26 @@
+"""Cost of generating the random default values of the fields."""
+import json
+import uuid
+
+from . import measure
+from . import setup
+
+NUMBER = 20000
+
+
+def run():
+    import native_shortuuid
+    from native_shortuuid import fields
+
+    return {
+        'uuid4_ns': measure(lambda: [uuid.uuid4() for _ in range(NUMBER)], NUMBER),
+        'uuid4_12bits_masked_ns': measure(lambda: [fields.uuid4_12bits_masked() for _ in range(NUMBER)], NUMBER),
+        'short_uuid4_ns': measure(lambda: [fields.short_uuid4() for _ in range(NUMBER)], NUMBER),
+        'short_uuid4_20_ns': measure(lambda: [fields.short_uuid4_20() for _ in range(NUMBER)], NUMBER),
+        'generate_many_20_ns': measure(lambda: native_shortuuid.generate_many(NUMBER, length=20), NUMBER),
+    }
+
+
+if __name__ == '__main__':
+    setup()
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,43 @@
+"""Inserting 100k rows into SQLite with random and time-ordered primary keys.
+
+The ordered keys are appended at the end of the primary key index instead of
+splitting pages all over it.
+"""
+import json
+import time
+
+from . import setup
+
+ROWS = 100000
+BATCH_SIZE = 1000
+
+
+def insert_rows(model):
+    """Return the nanoseconds per row spent creating the objects and inserting them by batches."""
+    model.objects.all().delete()
+    start = time.perf_counter()
+    for _ in range(ROWS // BATCH_SIZE):
+        model.objects.bulk_create([model() for _ in range(BATCH_SIZE)])
+    elapsed = time.perf_counter() - start
+    model.objects.all().delete()
+    return round(elapsed / ROWS * 1e9, 1)
+
+
+def run():
+    from tests.models import OrderedShortUUID20Model
+    from tests.models import OrderedShortUUIDModel
+    from tests.models import PrimaryKeyShortUUID20Model
+    from tests.models import PrimaryKeyShortUUIDModel
+
+    return {
+        model.__name__: {'insert_ns': min(insert_rows(model) for _ in range(3))}
+        for model in (
+            PrimaryKeyShortUUIDModel, OrderedShortUUIDModel,
+            PrimaryKeyShortUUID20Model, OrderedShortUUID20Model,
+        )
+    }
+
+
+if __name__ == '__main__':
+    setup()
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,39 @@
+"""Loading 100k rows from SQLite, where from_db_value runs once per row.
+
+``values_list_keep_uuid_ns`` loads the values with ``NATIVE_SHORTUUID_KEEP_UUID``.
+"""
+import json
+
+from . import measure
+from . import setup
+
+ROWS = 100000
+
+
+def run():
+    from django.test import override_settings
+
+    from native_shortuuid import short_uuid4_20
+    from native_shortuuid.fields import short_uuid4
+    from tests.models import ShortUUID20Model
+    from tests.models import ShortUUIDModel
+
+    results = {}
+    for model, default in ((ShortUUIDModel, short_uuid4), (ShortUUID20Model, short_uuid4_20)):
+        model.objects.all().delete()
+        model.objects.bulk_create([model(field=default()) for _ in range(ROWS)], batch_size=5000)
+        results[model.__name__] = {
+            'values_list_ns': measure(lambda: list(model.objects.values_list('field', flat=True)), ROWS, repeat=3),
+            'instances_ns': measure(lambda: list(model.objects.all()), ROWS, repeat=3),
+        }
+        with override_settings(NATIVE_SHORTUUID_KEEP_UUID=True):
+            results[model.__name__]['values_list_keep_uuid_ns'] = measure(
+                lambda: list(model.objects.values_list('field', flat=True)), ROWS, repeat=3,
+            )
+        model.objects.all().delete()
+    return results
+
+
+if __name__ == '__main__':
+    setup()
+    print(json.dumps(run(), indent=2))
@@ -0,0 +1,60 @@
+"""DRF list serialization and validation with the shortuuid serializer fields."""
+import json
+import uuid
+
+from . import measure
+from . import setup
+
+OBJECTS = 10000
+
+
+def run():
+    import rest_framework.serializers
+    from native_shortuuid import uuid4_12bits_masked
+    from native_shortuuid.fields import LeanShortUUID20SerializerField
+    from native_shortuuid.fields import LeanShortUUIDSerializerField
+    from native_shortuuid.fields import NativeShortUUID20SerializerField
+    from native_shortuuid.fields import NativeShortUUIDSerializerField
+    from native_shortuuid.serializers import ShortUUIDListSerializer
+    from native_shortuuid.values import ShortUUIDString
+
+    class Serializer(rest_framework.serializers.Serializer):
+        field = NativeShortUUIDSerializerField()
+        field20 = NativeShortUUID20SerializerField()
+
+    class BatchSerializer(Serializer):
+        class Meta:
+            list_serializer_class = ShortUUIDListSerializer
+
+    class LeanSerializer(rest_framework.serializers.Serializer):
+        field = LeanShortUUIDSerializerField()
+        field20 = LeanShortUUID20SerializerField()
+
+    class LeanUUIDSerializer(rest_framework.serializers.Serializer):
+        field = LeanShortUUIDSerializerField(return_uuid=True)
+        field20 = LeanShortUUID20SerializerField(return_uuid=True)
+
+    class Object:
+        def __init__(self):
+            self.field = ShortUUIDString.from_uuid(uuid.uuid4())
+            self.field20 = ShortUUIDString.from_uuid20(uuid4_12bits_masked())
+
+    objects = [Object() for _ in range(OBJECTS)]
+    payload = [{'field': str(obj.field), 'field20': str(obj.field20)} for obj in objects]
+
+    def validate(serializer_class=Serializer):
+        serializer = serializer_class(data=payload, many=True)
+        serializer.is_valid(raise_exception=True)
+
+    return {
+        'to_representation_ns': measure(lambda: Serializer(objects, many=True).data, OBJECTS, repeat=3),
+        'list_serializer_to_representation_ns': measure(lambda: BatchSerializer(objects, many=True).data, OBJECTS, repeat=3),
+        'to_internal_value_ns': measure(validate, OBJECTS, repeat=3),
+        'lean_to_internal_value_ns': measure(lambda: validate(LeanSerializer), OBJECTS, repeat=3),
+        'lean_uuid_to_internal_value_ns': measure(lambda: validate(LeanUUIDSerializer), OBJECTS, repeat=3),
+    }
+
+
+if __name__ == '__main__':
+    setup()
+    print(json.dumps(run(), indent=2))
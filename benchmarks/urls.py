@@ -0,0 +1,49 @@
+"""URL resolving with the shortuuid path converters."""
+import json
+
+from . import measure
+from . import setup
+
+NUMBER = 20000
+
+
+def view(request, value):
+    pass
+
+
+urlpatterns = []
+
+
+def run():
+    from django.urls import path
+    from django.urls import resolve
+    from django.urls import set_urlconf
+
+    import native_shortuuid.validation  # noqa: F401, registers the converters
+    from native_shortuuid.fields import short_uuid4
+
+    urlpatterns[:] = [
+        path('shortuuid/<shortuuid:value>/', view),
+        path('shortuuid20/<shortuuid20:value>/', view),
+        path('decoded_shortuuid/<decoded_shortuuid:value>/', view),
+        path('decoded_shortuuid20/<decoded_shortuuid20:value>/', view),
+    ]
+    set_urlconf(__name__)
+    try:
+        paths = [f'/shortuuid/{short_uuid4()}/' for _ in range(NUMBER)]
+        paths20 = [f'/shortuuid20/{short_uuid4()}/' for _ in range(NUMBER)]
+        decoded_paths = [f'/decoded_shortuuid/{short_uuid4()}/' for _ in range(NUMBER)]
+        decoded_paths20 = [f'/decoded_shortuuid20/{short_uuid4()}/' for _ in range(NUMBER)]
+        return {
+            'shortuuid_resolve_ns': measure(lambda: [resolve(path) for path in paths], NUMBER),
+            'shortuuid20_resolve_ns': measure(lambda: [resolve(path) for path in paths20], NUMBER),
+            'decoded_shortuuid_resolve_ns': measure(lambda: [resolve(path) for path in decoded_paths], NUMBER),
+            'decoded_shortuuid20_resolve_ns': measure(lambda: [resolve(path) for path in decoded_paths20], NUMBER),
+        }
+    finally:
+        set_urlconf(None)
+
+
+if __name__ == '__main__':
+    setup()
+    print(json.dumps(run(), indent=2))
@@ -3,6 +3,10 @@ from __future__ import absolute_import
 from . import validation
 from .admin import NativeUUID20SearchMixin
 from .admin import NativeUUIDSearchMixin
+from .batch import ShortUUIDBatchError
+from .batch import decode_many
+from .batch import encode_many
+from .codec import is_valid
 from .fields import NativeShortUUID20Field
 from .fields import NativeShortUUID20FormField
 from .fields import NativeShortUUIDField
@@ -11,6 +15,9 @@ from .fields import convert_uuid_to_uuid_v2
 from .fields import decode
 from .fields import short_uuid4_20
 from .fields import uuid4_12bits_masked
+from .fields import uuid7
+from .fields import uuid7_116bits
+from .generators import generate_many
 
 try:
     from importlib.metadata import version
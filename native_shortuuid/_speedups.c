@@ -0,0 +1,167 @@
+/*
+ * Optional C implementation of the base-57 conversions in native_shortuuid.codec.
+ *
+ * The 128-bit value is handled as four 32-bit limbs (most significant first) so
+ * the code does not depend on compiler specific 128-bit integer support.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <string.h>
+
+#define BASE 57
+#define LENGTH 22
+#define INVALID 0xff
+
+static const char ALPHABET[] = "23456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz";
+static unsigned char DIGITS[256];
+
+static void
+encode22(const unsigned char *bytes, char *out)
+{
+    uint32_t limbs[4];
+    int i, j;
+
+    for (i = 0; i < 4; i++) {
+        limbs[i] = ((uint32_t)bytes[4 * i] << 24) | ((uint32_t)bytes[4 * i + 1] << 16) |
+                   ((uint32_t)bytes[4 * i + 2] << 8) | (uint32_t)bytes[4 * i + 3];
+    }
+    for (i = LENGTH - 1; i >= 0; i--) {
+        uint64_t remainder = 0;
+        for (j = 0; j < 4; j++) {
+            uint64_t current = (remainder << 32) | limbs[j];
+            limbs[j] = (uint32_t)(current / BASE);
+            remainder = current % BASE;
+        }
+        out[i] = ALPHABET[remainder];
+    }
+}
+
+static PyObject *
+speedups_encode(PyObject *module, PyObject *args)
+{
+    Py_buffer buffer;
+    Py_ssize_t pad_length = LENGTH;
+    char digits[LENGTH];
+    const char *start;
+    Py_ssize_t length, fill = 0;
+    PyObject *result;
+
+    if (!PyArg_ParseTuple(args, "y*|n:encode", &buffer, &pad_length)) {
+        return NULL;
+    }
+    if (buffer.len != 16) {
+        PyBuffer_Release(&buffer);
+        PyErr_SetString(PyExc_ValueError, "bytes is not a 16-char string");
+        return NULL;
+    }
+    encode22((const unsigned char *)buffer.buf, digits);
+    PyBuffer_Release(&buffer);
+
+    if (pad_length < 0) {
+        pad_length = 0;
+    }
+    start = digits;
+    length = LENGTH;
+    if (pad_length > LENGTH) {
+        fill = pad_length - LENGTH;
+    }
+    else {
+        /* Strip the leading zero digits, keeping at least pad_length of them. */
+        while (length > pad_length && *start == ALPHABET[0]) {
+            start++;
+            length--;
+        }
+    }
+
+    result = PyUnicode_New(fill + length, 127);
+    if (result == NULL) {
+        return NULL;
+    }
+    memset(PyUnicode_1BYTE_DATA(result), ALPHABET[0], fill);
+    memcpy(PyUnicode_1BYTE_DATA(result) + fill, start, length);
+    return result;
+}
+
+static PyObject *
+speedups_decode(PyObject *module, PyObject *string)
+{
+    const unsigned char *data;
+    Py_ssize_t length, i;
+    uint32_t limbs[4] = {0, 0, 0, 0};
+    unsigned char bytes[16];
+    int j;
+
+    if (!PyUnicode_Check(string)) {
+        PyErr_SetString(PyExc_ValueError, "Input `string` must be a str.");
+        return NULL;
+    }
+#if PY_VERSION_HEX < 0x030C0000
+    if (PyUnicode_READY(string) < 0) {
+        return NULL;
+    }
+#endif
+    if (!PyUnicode_IS_ASCII(string)) {
+        PyErr_SetString(PyExc_ValueError, "Badly formed ShortUUID");
+        return NULL;
+    }
+    data = PyUnicode_1BYTE_DATA(string);
+    length = PyUnicode_GET_LENGTH(string);
+
+    for (i = 0; i < length; i++) {
+        uint64_t carry = DIGITS[data[i]];
+        if (carry == INVALID) {
+            PyErr_SetString(PyExc_ValueError, "Badly formed ShortUUID");
+            return NULL;
+        }
+        for (j = 3; j >= 0; j--) {
+            uint64_t current = (uint64_t)limbs[j] * BASE + carry;
+            limbs[j] = (uint32_t)current;
+            carry = current >> 32;
+        }
+        if (carry) {
+            PyErr_SetString(PyExc_ValueError, "int is out of range (need a 128-bit value)");
+            return NULL;
+        }
+    }
+
+    for (j = 0; j < 4; j++) {
+        bytes[4 * j] = (unsigned char)(limbs[j] >> 24);
+        bytes[4 * j + 1] = (unsigned char)(limbs[j] >> 16);
+        bytes[4 * j + 2] = (unsigned char)(limbs[j] >> 8);
+        bytes[4 * j + 3] = (unsigned char)limbs[j];
+    }
+#if PY_VERSION_HEX >= 0x030D0000
+    return PyLong_FromUnsignedNativeBytes(bytes, 16, Py_ASNATIVEBYTES_BIG_ENDIAN);
+#else
+    return _PyLong_FromByteArray(bytes, 16, 0, 0);
+#endif
+}
+
+static PyMethodDef speedups_methods[] = {
+    {"encode", speedups_encode, METH_VARARGS,
+     "encode(uuid_bytes, pad_length=22)\n--\n\nEncode the 16 big-endian bytes of a UUID into a ShortUUID."},
+    {"decode", speedups_decode, METH_O,
+     "decode(string)\n--\n\nDecode a ShortUUID into a 128-bit integer."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    "native_shortuuid._speedups",
+    "C implementation of the native_shortuuid base-57 codec.",
+    -1,
+    speedups_methods
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    int i;
+
+    memset(DIGITS, INVALID, sizeof(DIGITS));
+    for (i = 0; i < BASE; i++) {
+        DIGITS[(unsigned char)ALPHABET[i]] = (unsigned char)i;
+    }
+    return PyModule_Create(&speedups_module);
+}
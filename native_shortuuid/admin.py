@@ -1,50 +1,201 @@
+import functools
+import uuid
+
 import django.conf
 import django.db.models
+from django.contrib.admin.utils import lookup_spawns_duplicates
+from django.contrib.admin.views.main import ChangeList
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.constants import LOOKUP_SEP
 
 import native_shortuuid
+from native_shortuuid import codec
+
+# Number of (ModelAdmin, search fields) splits kept, get_search_fields may vary per request
+SEARCH_FIELDS_SPLIT_CACHE_SIZE = 256
+# ChangeList class -> its subclass with NativeUUIDChangeListMixin
+_changelist_classes = {}
+
+
+@functools.lru_cache(maxsize=SEARCH_FIELDS_SPLIT_CACHE_SIZE)
+def _split_search_fields(model_admin, search_fields):
+    uuid_fields = []
+    other_fields = []
+    for search_field in search_fields:
+        if model_admin.is_model_field_native_short_uuid(search_field) or search_field.endswith('uuid'):
+            uuid_fields.append(search_field.lstrip('^=@'))
+        else:
+            other_fields.append(search_field)
+    return tuple(uuid_fields), tuple(other_fields)
+
+
+class NativeUUIDChangeListMixin:
+    """ChangeList mixin which doesn't count all the rows when the search resolved to a UUID.
+
+    An exact UUID search matches a handful of rows, which are counted with a
+    query bounded by the page length, and the total number of rows is not
+    counted at all.
+    """
+
+    def get_results(self, request):
+        if not self.model_admin.is_uuid_search(request, self.query):
+            return super().get_results(request)
+        result_count = self.queryset[:self.list_per_page + 1].count()
+        if result_count > self.list_per_page:
+            return super().get_results(request)
+
+        self.result_count = result_count
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.full_result_count = None
+        self.result_list = self.queryset._clone()
+        self.can_show_all = result_count <= self.list_max_show_all
+        self.multi_page = False
+        self.paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        # Already counted, the templates must not count again
+        self.paginator.count = result_count
+
+
+class NativeUUIDChangeList(NativeUUIDChangeListMixin, ChangeList):
+    pass
+
+
+def get_uuid_changelist_class(changelist_class):
+    """Return the subclass of ``changelist_class`` with NativeUUIDChangeListMixin."""
+    if issubclass(changelist_class, NativeUUIDChangeListMixin):
+        return changelist_class
+    if changelist_class is ChangeList:
+        return NativeUUIDChangeList
+    try:
+        return _changelist_classes[changelist_class]
+    except KeyError:
+        uuid_changelist_class = type(
+            f'NativeUUID{changelist_class.__name__}', (NativeUUIDChangeListMixin, changelist_class, ),
+            {'__module__': changelist_class.__module__},
+        )
+        return _changelist_classes.setdefault(changelist_class, uuid_changelist_class)
 
 
 class NativeUUIDSearchMixin:
     search_uuid_fields = []
     admin_auto_extract_uuid_search_fields = True  # To customize a specific admins instead of all
     change_list_template = 'admin/native_shortuuid/custom_change_list.html'
+    search_uuid_short_circuit = False  # One exact lookup per UUID field, up to the first one matching rows
+    search_uuid_accept_hex = False  # Also search the pasted hex or dashed UUIDs
 
     def is_valid_shortuuid(self, search_term):
-        try:
-            # It's not decode-able, thus, not a shortuuid
-            native_shortuuid.decode(search_term)
-        except ValueError:
-            return False
+        return native_shortuuid.is_valid(search_term)
+
+    def get_search_uuid(self, search_term):
+        """Return the UUID the search term stands for, or None when it is not a ShortUUID.
+
+        Hex and dashed UUIDs are accepted as well when ``search_uuid_accept_hex`` is set.
+        """
+        if not search_term:
+            return None
+        search_term = search_term.strip()
+        if self.is_valid_shortuuid(search_term):
+            return codec.decode(search_term)
+        if self.search_uuid_accept_hex and len(search_term) in (32, 36, ):
+            try:
+                return uuid.UUID(search_term)
+            except ValueError:
+                return None
+        return None
 
-        return True
+    def get_request_search_uuid(self, request, search_term):
+        """Return ``get_search_uuid(search_term)``, computed once per request for the search results and the ChangeList."""
+        cached = getattr(request, '_native_shortuuid_search_uuid', None)
+        if cached is not None and cached[0] == search_term:
+            return cached[1]
+        value = self.get_search_uuid(search_term)
+        request._native_shortuuid_search_uuid = (search_term, value)
+        return value
+
+    def get_search_model_field(self, search_field):
+        """Return the model field searched by a search_fields entry such as ``foreign_model__uuid``, or None."""
+        opts = self.model._meta
+        field = None
+        for name in search_field.lstrip('^=@').split(LOOKUP_SEP):
+            if field is not None:
+                if not field.is_relation:
+                    # Lookup such as uuid__exact
+                    break
+                opts = field.related_model._meta
+            try:
+                field = opts.pk if name == 'pk' else opts.get_field(name)
+            except FieldDoesNotExist:
+                return None
+        if isinstance(field, django.db.models.ForeignKey):
+            field = field.target_field
+        return field
 
     def is_model_field_native_short_uuid(self, search_field):
-        model_field = next((field for field in self.model._meta.fields if field.attname == search_field), None)
-        return model_field and (
-            isinstance(model_field, native_shortuuid.NativeShortUUIDField) or
-            isinstance(model_field, native_shortuuid.NativeShortUUID20Field))
+        model_field = self.get_search_model_field(search_field)
+        return isinstance(model_field, (native_shortuuid.NativeShortUUIDField, native_shortuuid.NativeShortUUID20Field, ))
 
-    def get_search_fields(self, request):
-        search_fields = list(super().get_search_fields(request) or [])
+    def get_search_uuid_lookup_value(self, search_field, value, search_term):
+        """Return the value searched in a UUID search field: the UUID for the UUID fields, the search term otherwise.
+
+        The fields only selected because their name ends with ``uuid`` may store the ShortUUID text.
+        """
+        if isinstance(self.get_search_model_field(search_field), django.db.models.UUIDField):
+            return value
+        return search_term
+
+    def split_search_fields(self, search_fields):
+        """Split the search fields into the UUID ones, without their lookup prefix, and the other ones.
+
+        The split only depends on the admin and the search fields, it is
+        computed once for them (for the last SEARCH_FIELDS_SPLIT_CACHE_SIZE ones).
+        """
+        return _split_search_fields(self, tuple(search_fields))
+
+    def get_search_fields_split(self, request):
+        search_fields = tuple(super().get_search_fields(request) or ())
         if getattr(django.conf.settings, 'ADMIN_AUTO_EXTRACT_UUID_SEARCH_FIELDS', True) \
                 and self.admin_auto_extract_uuid_search_fields:
-            self.search_uuid_fields = []
-            for search_field in search_fields.copy():
-                if self.is_model_field_native_short_uuid(search_field) or search_field.endswith('uuid'):
-                    self.search_uuid_fields.append(search_field)
-                    search_fields.remove(search_field)
+            return self.split_search_fields(search_fields)
+        return tuple(self.search_uuid_fields), search_fields
+
+    def get_search_uuid_fields(self, request):
+        return self.get_search_fields_split(request)[0]
+
+    def get_search_fields(self, request):
+        search_fields = list(self.get_search_fields_split(request)[1])
         return search_fields or self.get_non_uuid_search_fields()
 
+    def is_uuid_search(self, request, search_term):
+        """Return whether the search is an exact UUID search, which matches a bounded number of rows."""
+        return bool(self.get_search_uuid_fields(request)) and self.get_request_search_uuid(request, search_term) is not None
+
+    def get_changelist(self, request, **kwargs):
+        # Keeps the ChangeList customizations of the other classes of the admin
+        return get_uuid_changelist_class(super().get_changelist(request, **kwargs))
+
     def get_search_results(self, request, queryset, search_term):
-        results_queryset, use_distinct = super().get_search_results(request, queryset, search_term)
+        search_uuid_fields = self.get_search_uuid_fields(request)
+        value = self.get_request_search_uuid(request, search_term) if search_uuid_fields else None
+        if value is None:
+            return super().get_search_results(request, queryset, search_term)
 
-        field_queries = django.db.models.Q()
-        if self.search_uuid_fields and search_term and self.is_valid_shortuuid(search_term):
-            for field_name_uuid in self.search_uuid_fields:
-                field_queries |= django.db.models.Q(**{field_name_uuid: search_term})
-            return queryset.filter(field_queries), use_distinct
+        # The term is decoded once, the lookups of the UUID fields get the UUID itself
+        may_have_duplicates = any(lookup_spawns_duplicates(self.opts, field) for field in search_uuid_fields)
+        lookups = [
+            (field_name_uuid, self.get_search_uuid_lookup_value(field_name_uuid, value, search_term))
+            for field_name_uuid in search_uuid_fields
+        ]
+        if self.search_uuid_short_circuit:
+            for field_name_uuid, lookup_value in lookups:
+                results_queryset = queryset.filter(**{field_name_uuid: lookup_value})
+                if results_queryset.exists():
+                    return results_queryset, may_have_duplicates
+            return queryset.none(), False
 
-        return results_queryset, use_distinct
+        field_queries = django.db.models.Q()
+        for field_name_uuid, lookup_value in lookups:
+            field_queries |= django.db.models.Q(**{field_name_uuid: lookup_value})
+        return queryset.filter(field_queries), may_have_duplicates
 
     def get_non_uuid_search_fields(self) -> tuple:
         """Returns the fallback list of non-UUID search fields"""
@@ -55,14 +206,8 @@ class NativeUUIDSearchMixin:
 
 class NativeUUID20SearchMixin(NativeUUIDSearchMixin):
     def is_valid_shortuuid(self, search_term):
-        try:
-            # It's not decode-able, thus, not a shortuuid
-            native_shortuuid.decode(search_term)
-        except ValueError:
-            return False
-
-        return True
+        return native_shortuuid.is_valid(search_term)
 
     def is_model_field_native_short_uuid(self, search_field):
-        model_field = next((field for field in self.model._meta.fields if field.attname == search_field), None)
-        return model_field and isinstance(model_field, native_shortuuid.NativeShortUUID20Field)
+        model_field = self.get_search_model_field(search_field)
+        return isinstance(model_field, native_shortuuid.NativeShortUUID20Field)
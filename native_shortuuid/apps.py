@@ -1,5 +1,10 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class NativeShortuuidConfig(AppConfig):
     name = 'native_shortuuid'
+
+    def ready(self):
+        from .functions import register_sqlite_functions
+        connection_created.connect(register_sqlite_functions)
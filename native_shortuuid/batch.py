@@ -0,0 +1,189 @@
+"""Conversions between many UUIDs and ShortUUIDs at once.
+
+``encode_many`` and ``decode_many`` go through the whole batch and report every
+invalid item instead of stopping at the first one. When NumPy is installed and
+the C accelerator is not, large batches are converted column by column on
+arrays of 32-bit limbs instead of one Python int at a time.
+"""
+import uuid
+
+from . import codec
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Smaller batches are faster to convert one item at a time.
+NUMPY_THRESHOLD = 256
+
+_LENGTHS = (codec.LENGTH20, codec.LENGTH, )
+
+
+class ShortUUIDBatchError(ValueError):
+    """Raised when some items of a batch can't be converted.
+
+    ``errors`` maps the index of every invalid item to its ValueError.
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(f'{len(errors)} invalid item(s) at index {", ".join(map(str, sorted(errors)[:10]))}')
+
+
+def _use_numpy(values):
+    # The C accelerator converting item by item is still faster than NumPy.
+    return numpy is not None and codec._speedups is None and len(values) >= NUMPY_THRESHOLD
+
+
+def encode_many(values, pad_length=None):
+    """Encode an iterable of UUIDs into a list of ShortUUIDs.
+
+    None items are kept as None. Raises ShortUUIDBatchError listing all the
+    items which are not UUIDs.
+    """
+    values = list(values)
+    if pad_length is None:
+        pad_length = codec.LENGTH
+    errors = {}
+    if _use_numpy(values):
+        strings = _numpy_encode_many(values, pad_length, errors)
+    else:
+        strings = []
+        append = strings.append
+        encode = codec.encode
+        for index, value in enumerate(values):
+            if value is None:
+                append(None)
+                continue
+            try:
+                append(encode(value, pad_length))
+            except ValueError as e:
+                errors[index] = e
+                append(None)
+    if errors:
+        raise ShortUUIDBatchError(errors)
+    return strings
+
+
+def encode20_many(values):
+    """Encode an iterable of UUIDs into 20 chars ShortUUIDs, or 22 chars for UUIDs that don't fit.
+
+    Same as ``codec.encode20`` for every item, see ``encode_many``.
+    """
+    return [
+        string[2:] if string is not None and string[:2] == '22' else string
+        for string in encode_many(values)
+    ]
+
+
+def decode_many(values, strict=True):
+    """Decode an iterable of 20 or 22 chars ShortUUIDs into a list of UUIDs.
+
+    None items are kept as None. Invalid items raise a ShortUUIDBatchError
+    listing all of them, or are returned as None when ``strict`` is False.
+    """
+    values = list(values)
+    errors = {}
+    if _use_numpy(values):
+        uuids = _numpy_decode_many(values, errors)
+    else:
+        uuids = []
+        append = uuids.append
+        decode = codec.decode
+        for index, value in enumerate(values):
+            if value is None:
+                append(None)
+                continue
+            try:
+                if not isinstance(value, str) or len(value) not in _LENGTHS:
+                    raise ValueError('Badly formed ShortUUID')
+                append(decode(value))
+            except ValueError as e:
+                errors[index] = e
+                append(None)
+    if errors and strict:
+        raise ShortUUIDBatchError(errors)
+    return uuids
+
+
+if numpy is not None:
+    _BASE2 = codec.BASE * codec.BASE
+    _MASK32 = numpy.uint64(0xffffffff)
+    _SHIFT32 = numpy.uint64(32)
+    _PAIRS = numpy.frombuffer(''.join(codec._PAIRS).encode('ascii'), dtype=numpy.uint8).reshape(-1, 2)
+    _DIGITS = numpy.frombuffer(codec._DIGITS, dtype=numpy.uint8)
+
+    def _numpy_encode_many(values, pad_length, errors):
+        strings = [None] * len(values)
+        indexes = []
+        chunks = []
+        for index, value in enumerate(values):
+            if value is None:
+                continue
+            if not isinstance(value, uuid.UUID):
+                errors[index] = ValueError('Input `uuid` must be a UUID object.')
+                continue
+            indexes.append(index)
+            chunks.append(value.bytes)
+        if not indexes:
+            return strings
+
+        limbs = numpy.frombuffer(b''.join(chunks), dtype='>u4').reshape(-1, 4).astype(numpy.uint64).T.copy()
+        pairs = numpy.empty((len(indexes), codec.LENGTH // 2), dtype=numpy.intp)
+        divisor = numpy.uint64(_BASE2)
+        # Long division of the four limbs by 57 ** 2, least significant pair first.
+        for position in range(codec.LENGTH // 2 - 1, -1, -1):
+            remainder = numpy.zeros(len(indexes), dtype=numpy.uint64)
+            for limb in limbs:
+                current = (remainder << _SHIFT32) | limb
+                limb[:] = current // divisor
+                remainder = current - limb * divisor
+            pairs[:, position] = remainder
+
+        text = _PAIRS[pairs].tobytes().decode('ascii')
+        length = codec.LENGTH
+        for position, index in enumerate(indexes):
+            string = text[position * length:(position + 1) * length]
+            strings[index] = string if pad_length == length else codec.pad(string, pad_length)
+        return strings
+
+    def _numpy_decode_many(values, errors):
+        uuids = [None] * len(values)
+        groups = {length: ([], []) for length in _LENGTHS}
+        for index, value in enumerate(values):
+            if value is None:
+                continue
+            if not isinstance(value, str) or len(value) not in _LENGTHS or not value.isascii():
+                errors[index] = ValueError('Badly formed ShortUUID')
+                continue
+            group_indexes, group_values = groups[len(value)]
+            group_indexes.append(index)
+            group_values.append(value)
+
+        for length, (indexes, strings) in groups.items():
+            if not indexes:
+                continue
+            digits = _DIGITS[numpy.frombuffer(''.join(strings).encode('ascii'), dtype=numpy.uint8)]
+            digits = digits.reshape(-1, length).astype(numpy.uint64)
+            invalid = (digits == codec._INVALID).any(axis=1)
+            overflow = numpy.zeros(len(indexes), dtype=bool)
+            limbs = numpy.zeros((4, len(indexes)), dtype=numpy.uint64)
+            multiplier = numpy.uint64(_BASE2)
+            for position in range(0, length, 2):
+                carry = digits[:, position] * numpy.uint64(codec.BASE) + digits[:, position + 1]
+                for limb in limbs[::-1]:
+                    current = limb * multiplier + carry
+                    limb[:] = current & _MASK32
+                    carry = current >> _SHIFT32
+                overflow |= carry != 0
+
+            data = limbs.T.astype('>u4').tobytes()
+            for position, index in enumerate(indexes):
+                if invalid[position]:
+                    errors[index] = ValueError('Badly formed ShortUUID')
+                elif overflow[position]:
+                    errors[index] = ValueError('int is out of range (need a 128-bit value)')
+                else:
+                    uuids[index] = codec.uuid_from_int(int.from_bytes(data[position * 16:(position + 1) * 16], 'big'))
+        return uuids
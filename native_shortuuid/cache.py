@@ -0,0 +1,94 @@
+"""Opt-in memoization of the UUID <-> ShortUUID conversions done by the fields.
+
+Enabled by the ``NATIVE_SHORTUUID_CACHE_SIZE`` setting, which is the maximum
+number of entries kept by each LRU cache. Every ShortUUID form (22 and 20 chars)
+has its own encode and decode caches, see ``cache_info()`` for their hits and misses.
+
+The ``NATIVE_SHORTUUID_KEEP_UUID`` setting selects the encode function keeping
+the UUID on the ShortUUID (ShortUUIDString) instead of the plain one.
+"""
+import functools
+
+import django.conf
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+_registry = {}
+
+
+class ConversionCache:
+    """Encode and decode functions memoized with bounded ``functools.lru_cache``.
+
+    The ``encode`` and ``decode`` attributes are resolved on first access from
+    the ``NATIVE_SHORTUUID_CACHE_SIZE`` and ``NATIVE_SHORTUUID_KEEP_UUID``
+    settings, then looked up directly.
+    """
+
+    def __init__(self, name, encode, decode, keep_uuid_encode=None):
+        self.name = name
+        self._encode = encode
+        self._decode = decode
+        self._keep_uuid_encode = keep_uuid_encode or encode
+        _registry[name] = self
+
+    def __getattr__(self, name):
+        if name not in ('encode', 'decode', ):
+            raise AttributeError(name)
+        self.configure(
+            getattr(django.conf.settings, 'NATIVE_SHORTUUID_CACHE_SIZE', 0),
+            getattr(django.conf.settings, 'NATIVE_SHORTUUID_KEEP_UUID', False),
+        )
+        return self.__dict__[name]
+
+    def configure(self, maxsize, keep_uuid=False):
+        encode = self._keep_uuid_encode if keep_uuid else self._encode
+        if not maxsize:
+            self.encode = encode
+            self.decode = self._decode
+            return
+
+        self.encode = functools.lru_cache(maxsize=maxsize)(encode)
+        cached_decode = functools.lru_cache(maxsize=maxsize)(self._decode)
+        decode = self._decode
+
+        def decode_str(value):
+            # Unhashable or non str values are left to the decode function to reject.
+            if isinstance(value, str):
+                return cached_decode(value)
+            return decode(value)
+
+        decode_str.cache_info = cached_decode.cache_info
+        decode_str.cache_clear = cached_decode.cache_clear
+        self.decode = decode_str
+
+    def reset(self):
+        self.__dict__.pop('encode', None)
+        self.__dict__.pop('decode', None)
+
+    def cache_info(self):
+        return {
+            name: function.cache_info() if hasattr(function, 'cache_info') else None
+            for name, function in (('encode', self.encode), ('decode', self.decode), )
+        }
+
+    def cache_clear(self):
+        for function in (self.encode, self.decode, ):
+            if hasattr(function, 'cache_clear'):
+                function.cache_clear()
+
+
+def cache_info():
+    """Return the hits/misses statistics of all the caches, None for the disabled ones."""
+    return {name: conversion_cache.cache_info() for name, conversion_cache in _registry.items()}
+
+
+def cache_clear():
+    for conversion_cache in _registry.values():
+        conversion_cache.cache_clear()
+
+
+@receiver(setting_changed)
+def reset_caches(setting, **kwargs):
+    if setting in ('NATIVE_SHORTUUID_CACHE_SIZE', 'NATIVE_SHORTUUID_KEEP_UUID', ):
+        for conversion_cache in _registry.values():
+            conversion_cache.reset()
@@ -0,0 +1,246 @@
+"""Base-57 codec compatible with the ``shortuuid`` package default alphabet.
+
+``shortuuid`` converts one character at a time with ``divmod`` and ``list.index``
+on Python big ints. The functions below produce exactly the same strings but
+work on precomputed tables: encoding emits two characters per ``divmod`` and
+decoding maps the whole string to digits with a single ``bytes.translate``.
+
+When the optional ``native_shortuuid._speedups`` C extension is built it replaces
+the pure Python conversions, unless the ``NATIVE_SHORTUUID_PURE_PYTHON``
+environment variable or Django setting is set.
+"""
+import os
+import uuid
+
+import django.conf
+
+ALPHABET = '23456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+BASE = len(ALPHABET)
+LENGTH = 22
+LENGTH20 = 20
+MAX_INT = (1 << 128) - 1
+MAX_INT20 = BASE ** LENGTH20 - 1
+
+_BASE2 = BASE * BASE
+_BASE11 = BASE ** 11
+_INVALID = 0xff
+
+# All the 57 * 57 two-characters combinations, indexed by their value.
+_PAIRS = tuple(high + low for high in ALPHABET for low in ALPHABET)
+
+# bytes.translate() table mapping every ASCII character to its digit value.
+_DIGITS = bytearray([_INVALID] * 256)
+for _digit, _char in enumerate(ALPHABET):
+    _DIGITS[ord(_char)] = _digit
+_DIGITS = bytes(_DIGITS)
+del _digit, _char
+
+
+def _int_to_string22(number):
+    divmod_ = divmod
+    number, r0 = divmod_(number, _BASE2)
+    number, r1 = divmod_(number, _BASE2)
+    number, r2 = divmod_(number, _BASE2)
+    number, r3 = divmod_(number, _BASE2)
+    number, r4 = divmod_(number, _BASE2)
+    number, r5 = divmod_(number, _BASE2)
+    number, r6 = divmod_(number, _BASE2)
+    number, r7 = divmod_(number, _BASE2)
+    number, r8 = divmod_(number, _BASE2)
+    number, r9 = divmod_(number, _BASE2)
+    pairs = _PAIRS
+    return (pairs[number] + pairs[r9] + pairs[r8] + pairs[r7] + pairs[r6] + pairs[r5] +
+            pairs[r4] + pairs[r3] + pairs[r2] + pairs[r1] + pairs[r0])
+
+
+def _int_to_string(number, pad_length=LENGTH):
+    """Encode a 128-bit integer, most significant digit first.
+
+    Same output as ``shortuuid.int_to_string`` with the default alphabet: the
+    result is padded to ``pad_length`` but never truncated.
+    """
+    if not 0 <= number <= MAX_INT:
+        raise ValueError('Integer is out of the UUID range')
+    return pad(_int_to_string22(number), pad_length)
+
+
+def pad(string, pad_length):
+    """Adjust the padding of a 22-chars encoded value to ``pad_length``."""
+    if pad_length == LENGTH:
+        return string
+    if pad_length > LENGTH:
+        return ALPHABET[0] * (pad_length - LENGTH) + string
+    significant = string.lstrip(ALPHABET[0])
+    if len(significant) < pad_length:
+        return string[LENGTH - pad_length:]
+    return significant
+
+
+def _string_to_int(string):
+    """Decode a base-57 string into an integer.
+
+    Raises ValueError when the string contains characters outside of the alphabet
+    or when the result does not fit in 128 bits.
+    """
+    digits = string.encode('ascii').translate(_DIGITS)
+    if _INVALID in digits:
+        raise ValueError('Badly formed ShortUUID')
+    if len(digits) == LENGTH:
+        (d0, d1, d2, d3, d4, d5, d6, d7, d8, d9, d10,
+         d11, d12, d13, d14, d15, d16, d17, d18, d19, d20, d21) = digits
+        # Two independent halves of 11 digits keep the intermediate ints small.
+        high = ((((((((((d0 * 57 + d1) * 57 + d2) * 57 + d3) * 57 + d4) * 57 + d5) * 57 + d6) * 57 + d7) * 57 +
+                  d8) * 57 + d9) * 57 + d10)
+        low = ((((((((((d11 * 57 + d12) * 57 + d13) * 57 + d14) * 57 + d15) * 57 + d16) * 57 + d17) * 57 +
+                 d18) * 57 + d19) * 57 + d20) * 57 + d21)
+        number = high * _BASE11 + low
+        if number > MAX_INT:
+            raise ValueError('int is out of range (need a 128-bit value)')
+        return number
+    number = 0
+    for digit in digits:
+        number = number * BASE + digit
+    if number > MAX_INT:
+        raise ValueError('int is out of range (need a 128-bit value)')
+    return number
+
+
+def _use_speedups():
+    if os.environ.get('NATIVE_SHORTUUID_PURE_PYTHON'):
+        return False
+    settings = django.conf.settings
+    return not (settings.configured and getattr(settings, 'NATIVE_SHORTUUID_PURE_PYTHON', False))
+
+
+_speedups = None
+if _use_speedups():
+    try:
+        from . import _speedups
+    except ImportError:
+        pass
+
+if _speedups is not None:
+    def int_to_string(number, pad_length=LENGTH):
+        if not 0 <= number <= MAX_INT:
+            raise ValueError('Integer is out of the UUID range')
+        return _speedups.encode(number.to_bytes(16, 'big'), pad_length)
+
+    string_to_int = _speedups.decode
+else:
+    int_to_string = _int_to_string
+    string_to_int = _string_to_int
+
+
+# The alphabet is sorted, so strings of the same length compare like their values.
+_MAX_STRING = _int_to_string22(MAX_INT)
+
+_new_object = object.__new__
+_set_attribute = object.__setattr__
+_SAFE_UNKNOWN = uuid.SafeUUID.unknown
+
+
+def uuid_from_int(number):
+    """Return the ``uuid.UUID`` of a 128-bit integer, without the checks of ``uuid.UUID.__init__``.
+
+    The integer must be in the UUID range, e.g. it comes from ``string_to_int``.
+    """
+    value = _new_object(uuid.UUID)
+    _set_attribute(value, 'int', number)
+    _set_attribute(value, 'is_safe', _SAFE_UNKNOWN)
+    return value
+
+
+def uuids_from_bytes(values):
+    """Return the ``uuid.UUID`` of the 16 big-endian bytes of every value, the UUIDs and None are kept."""
+    return [
+        value if value is None or isinstance(value, uuid.UUID) else uuid_from_int(int.from_bytes(value, 'big'))
+        for value in values
+    ]
+
+
+def bytes_to_string(data, pad_length=LENGTH):
+    """Encode the 16 big-endian bytes of a UUID into its ShortUUID."""
+    if len(data) != 16:
+        raise ValueError('bytes is not a 16-char string')
+    if _speedups is not None:
+        return _speedups.encode(bytes(data), pad_length)
+    return _int_to_string(int.from_bytes(data, 'big'), pad_length)
+
+
+def string_to_bytes(string):
+    """Decode a ShortUUID into the 16 big-endian bytes of its UUID."""
+    return string_to_int(string).to_bytes(16, 'big')
+
+
+def is_valid(string, length=None):
+    """Return whether the string is a valid ShortUUID, without decoding it.
+
+    ``length`` restricts the accepted length, 20 or 22 chars are accepted by default.
+    """
+    if not isinstance(string, str):
+        return False
+    string_length = len(string)
+    if length is None:
+        if string_length != LENGTH and string_length != LENGTH20:
+            return False
+    elif string_length != length:
+        return False
+    if not string.isascii() or _INVALID in string.encode('ascii').translate(_DIGITS):
+        return False
+    if string_length < LENGTH:
+        return True
+    if string_length > LENGTH:
+        if string[:-LENGTH].strip(ALPHABET[0]):
+            return False
+        string = string[-LENGTH:]
+    return string <= _MAX_STRING
+
+
+def prefix_range(prefix, length=LENGTH):
+    """Return the inclusive (low, high) range of the integers whose ``length`` chars encoding starts with ``prefix``.
+
+    Base-57 strings are big-endian, so the integers sharing a prefix are contiguous.
+    Returns None when the prefix is not valid or no 128-bit integer matches it.
+    """
+    if not isinstance(prefix, str) or len(prefix) > length or not prefix.isascii():
+        return None
+    digits = prefix.encode('ascii').translate(_DIGITS)
+    if _INVALID in digits:
+        return None
+    number = 0
+    for digit in digits:
+        number = number * BASE + digit
+    scale = BASE ** (length - len(prefix))
+    low = number * scale
+    if low > MAX_INT:
+        return None
+    return low, min(low + scale - 1, MAX_INT)
+
+
+def encode(value, pad_length=None):
+    """Encode a UUID into its ShortUUID, like ``shortuuid.encode``."""
+    if not isinstance(value, uuid.UUID):
+        raise ValueError('Input `uuid` must be a UUID object.')
+    if _speedups is not None:
+        return _speedups.encode(value.bytes, LENGTH if pad_length is None else pad_length)
+    return _int_to_string(value.int, LENGTH if pad_length is None else pad_length)
+
+
+def encode20(value):
+    """Encode a UUID into its 20 chars ShortUUID, or 22 chars for UUIDs that don't fit."""
+    string = encode(value)
+    if string[:2] == '22':
+        # Leading zero digits mean that the value fits in 20 chars,
+        # otherwise this is an old uuid which should result in 22 chars instead.
+        return string[2:]
+    return string
+
+
+def decode(string):
+    """Decode a ShortUUID into a UUID, like ``shortuuid.decode``.
+
+    Raises ValueError when the string contains illegal characters or does not fit in 128 bits.
+    """
+    if not isinstance(string, str):
+        raise ValueError('Input `string` must be a str.')
+    return uuid_from_int(string_to_int(string))
@@ -0,0 +1,97 @@
+"""Streaming exports of querysets with ShortUUID columns.
+
+The rows are read with ``QuerySet.iterator()``, which uses server-side cursors
+where the database supports them, and the UUIDs of every chunk are encoded in
+a single batch, so memory stays flat regardless of the table size.
+"""
+import csv
+import io
+
+import django.db.models
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models.constants import LOOKUP_SEP
+
+from . import batch
+from . import codec
+from .fields import NativeShortUUID20Field
+from .fields import NativeShortUUIDField
+
+DEFAULT_CHUNK_SIZE = 2000
+
+
+def _resolve_field(model, path):
+    field = None
+    for name in path.split(LOOKUP_SEP):
+        if field is not None:
+            model = field.related_model
+        field = model._meta.pk if name == 'pk' else model._meta.get_field(name)
+    if isinstance(field, django.db.models.ForeignKey):
+        field = field.target_field
+    return field
+
+
+def _get_encoder(field):
+    if isinstance(field, NativeShortUUID20Field):
+        return batch.encode20_many
+    if isinstance(field, NativeShortUUIDField):
+        return batch.encode_many
+    return None
+
+
+def iter_rows(queryset, fields, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield a tuple of the values of ``fields`` for every row of the queryset.
+
+    The native ShortUUID fields, including through relations (e.g. ``foreign_model__uuid``),
+    are read as UUIDs and encoded per chunk exactly like their field would.
+    """
+    model_fields = [_resolve_field(queryset.model, name) for name in fields]
+    encoders = [_get_encoder(field) for field in model_fields]
+    expressions = [
+        django.db.models.ExpressionWrapper(django.db.models.F(name), output_field=field.get_raw_output_field())
+        if encoder else name
+        for name, field, encoder in zip(fields, model_fields, encoders)
+    ]
+    uuid_columns = [(index, encoder) for index, encoder in enumerate(encoders) if encoder]
+
+    chunk = []
+    for row in queryset.values_list(*expressions).iterator(chunk_size=chunk_size):
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield from _encode_chunk(chunk, uuid_columns)
+            chunk = []
+    if chunk:
+        yield from _encode_chunk(chunk, uuid_columns)
+
+
+def _encode_chunk(chunk, uuid_columns):
+    if not uuid_columns:
+        return chunk
+    columns = list(zip(*chunk))
+    for index, encoder in uuid_columns:
+        columns[index] = encoder(codec.uuids_from_bytes(columns[index]))
+    return zip(*columns)
+
+
+def iter_csv(queryset, fields, chunk_size=DEFAULT_CHUNK_SIZE, header=True):
+    """Yield the rows of ``iter_rows`` as CSV lines, preceded by the field names when ``header`` is True."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def line(row):
+        writer.writerow(row)
+        value = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return value
+
+    if header:
+        yield line(fields)
+    for row in iter_rows(queryset, fields, chunk_size=chunk_size):
+        yield line(row)
+
+
+def iter_jsonl(queryset, fields, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield the rows of ``iter_rows`` as JSON objects, one per line."""
+    encoder = DjangoJSONEncoder()
+    for row in iter_rows(queryset, fields, chunk_size=chunk_size):
+        yield encoder.encode(dict(zip(fields, row))) + '\n'
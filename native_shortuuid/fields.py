@@ -6,33 +6,85 @@ from django.forms import CharField
 from django.utils.translation import gettext_lazy as _
 
 import rest_framework.serializers
-import shortuuid
+from . import batch
+from . import cache
+from . import codec
+from . import generators
+from . import lookups
+from .values import LazyShortUUID
+from .values import LazyShortUUID20
+from .values import ShortUUIDString
 
 
 def convert_uuid_to_uuid_v2(uuid22):
     if isinstance(uuid22, uuid.UUID):
-        uuid22 = shortuuid.encode(uuid22)
+        # The last 20 chars of the ShortUUID are the remainder of the division by 57 ** 20
+        return codec.uuid_from_int(uuid22.int % (codec.MAX_INT20 + 1))
 
     shortuuid20 = uuid22[-20:]
-    return shortuuid.decode(shortuuid20)
+    return codec.decode(shortuuid20)
+
+
+def convert_uuids_to_uuid_v2(values):
+    # Same as convert_uuid_to_uuid_v2 for every UUID of the list
+    modulus = codec.MAX_INT20 + 1
+    uuid_from_int = codec.uuid_from_int
+    return [uuid_from_int(value.int % modulus) for value in values]
 
 
 def uuid4_12bits_masked():
-    random_uuid = uuid.uuid4()
-    # Convert the UUID to its 128-bit integer representation
-    int_representation = random_uuid.int
-    bitmask = (1 << 116) - 1
-    modified_int = int_representation & bitmask
-    # Convert the modified integer back to a UUID
-    return uuid.UUID(int=modified_int)
+    # Random UUID with its 12 most significant bits cleared, so it fits in 20 chars
+    return codec.uuid_from_int(generators.uuid4_int() & generators.MASK116)
 
 
 def short_uuid4_20():
-    return shortuuid.encode(uuid4_12bits_masked(), pad_length=20)
+    value = uuid4_12bits_masked()
+    return ShortUUIDString(codec.encode(value, pad_length=20), value)
 
 
 def short_uuid4():
-    return shortuuid.encode(uuid.uuid4())
+    return ShortUUIDString.from_uuid(codec.uuid_from_int(generators.uuid4_int()))
+
+
+def uuid7():
+    # Time-ordered UUID, consecutive inserts land next to each other in the indexes
+    return codec.uuid_from_int(generators.uuid7_int())
+
+
+def uuid7_116bits():
+    # Time-ordered UUID with its 12 most significant bits cleared, so it fits in 20 chars
+    return codec.uuid_from_int(generators.uuid7_116bits_int())
+
+
+def short_uuid7():
+    return ShortUUIDString.from_uuid(uuid7())
+
+
+def short_uuid7_20():
+    value = uuid7_116bits()
+    return ShortUUIDString(codec.encode(value, pad_length=20), value)
+
+
+# Defaults producing UUIDs which the fields replace by their ShortUUID counterpart
+SHORTUUID_DEFAULTS = {
+    uuid.uuid4: short_uuid4,
+    uuid7: short_uuid7,
+}
+if hasattr(uuid, 'uuid7'):
+    SHORTUUID_DEFAULTS[uuid.uuid7] = short_uuid7
+
+SHORTUUID20_DEFAULTS = {
+    uuid4_12bits_masked: short_uuid4_20,
+    uuid7_116bits: short_uuid7_20,
+}
+
+
+def _get_shortuuid_default(default, defaults):
+    # Looked up by identity, like the defaults themselves, which may be unhashable
+    for uuid_default, shortuuid_default in defaults.items():
+        if uuid_default is default:
+            return shortuuid_default
+    return None
 
 
 def decode(value):
@@ -42,7 +94,28 @@ def decode(value):
     """
     if not isinstance(value, str) or len(value) not in (20, 22, ):
         raise ValueError('Badly formed ShortUUID')
-    return shortuuid.decode(value)
+    return codec.decode(value)
+
+
+def _encode_lazy_many(values):
+    """Replace the LazyShortUUIDs of the list by their strings, encoded in one batch per kind of LazyShortUUID."""
+    encoders = {codec.encode: batch.encode_many, codec.encode20: batch.encode20_many}
+    groups = {}
+    for index, value in enumerate(values):
+        if isinstance(value, LazyShortUUID):
+            if value._string is None and value.encode in encoders:
+                indexes, uuids = groups.setdefault(value.encode, ([], []))
+                indexes.append(index)
+                uuids.append(value.uuid)
+            else:
+                values[index] = str(value)
+    for encode, (indexes, uuids) in groups.items():
+        for index, string in zip(indexes, encoders[encode](uuids)):
+            values[index] = string
+
+
+shortuuid_cache = cache.ConversionCache('shortuuid', codec.encode, decode, ShortUUIDString.from_uuid)
+shortuuid20_cache = cache.ConversionCache('shortuuid20', codec.encode20, decode, ShortUUIDString.from_uuid20)
 
 
 class NativeShortUUIDFormField(CharField):
@@ -55,28 +128,23 @@ class NativeShortUUIDFormField(CharField):
         if value in self.empty_values:
             return None
         try:
-            decode(value)
+            return self.parse(value)
         except ValueError:
             raise ValidationError(self.error_messages['invalid'], code='invalid')
-        return value
 
+    def parse(self, value):
+        """Return the value as a ShortUUIDString carrying its UUID, so the model field doesn't decode it again."""
+        return ShortUUIDString(value, decode(value))
 
-class NativeShortUUID20FormField(NativeShortUUIDFormField):
-    def to_python(self, value):
-        value = super().to_python(value)
-        if value in self.empty_values:
-            return None
-
-        try:
-            decode(value)
-        except ValueError:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
 
+class NativeShortUUID20FormField(NativeShortUUIDFormField):
+    def parse(self, value):
         if len(value) == 22:
+            if not codec.is_valid(value):
+                raise ValueError('Badly formed ShortUUID')
             # Always trim the first 2 chars of a 22-chars shortuuid
             value = value[2:]
-
-        return value
+        return super().parse(value)
 
 
 class NativeShortUUIDSerializerField(rest_framework.serializers.CharField):
@@ -91,18 +159,36 @@ class NativeShortUUIDSerializerField(rest_framework.serializers.CharField):
         super().__init__(**kwargs)
 
     def to_internal_value(self, data):
-        # check that data is a valid shortuuid
+        # check that data is a valid shortuuid, the model field reuses its decoded UUID
         try:
-            decode(data)
-        except Exception:
+            return ShortUUIDString(data, decode(data))
+        except ValueError:
             self.fail('invalid', value=data)
-        return super().to_internal_value(data)
 
     def to_representation(self, value):
         if isinstance(value, uuid.UUID):
-            return shortuuid.encode(value)
+            return codec.encode(value)
         return str(value)
 
+    def to_representation_many(self, values):
+        """Return the representations of many values, the UUIDs among them are encoded in one batch.
+
+        Strings are returned as they are, without being copied. Other values
+        than UUIDs and strings, e.g. None, are returned unchanged.
+        """
+        values = list(values)
+        # Rendered like str(value), the LazyShortUUID20s with 20 chars
+        _encode_lazy_many(values)
+        indexes = []
+        uuids = []
+        for index, value in enumerate(values):
+            if isinstance(value, uuid.UUID):
+                indexes.append(index)
+                uuids.append(value)
+        for index, string in zip(indexes, batch.encode_many(uuids)):
+            values[index] = string
+        return values
+
 
 class NativeShortUUID20SerializerField(rest_framework.serializers.CharField):
     default_error_messages = {
@@ -116,51 +202,220 @@ class NativeShortUUID20SerializerField(rest_framework.serializers.CharField):
         super().__init__(**kwargs)
 
     def to_internal_value(self, data):
-        # check that data is a valid shortuuid
-        try:
-            decode(data)
-        except Exception:
+        # check that data is a valid shortuuid, the model field reuses its decoded UUID
+        if not codec.is_valid(data):
             self.fail('invalid', value=data)
 
         if len(data) == 22:
             data = data[2:]
 
-        return super().to_internal_value(data)
+        return ShortUUIDString(data, decode(data))
 
     def to_representation(self, value):
         if isinstance(value, uuid.UUID):
-            value = shortuuid.encode(value, pad_length=20)
+            value = codec.encode(value, pad_length=20)
         if len(value) == 22:
             value = value[2:]
         return str(value)
 
+    def to_representation_many(self, values):
+        """Return the representations of many values, see NativeShortUUIDSerializerField.to_representation_many."""
+        values = list(values)
+        _encode_lazy_many(values)
+        indexes = []
+        uuids = []
+        for index, value in enumerate(values):
+            if isinstance(value, uuid.UUID):
+                indexes.append(index)
+                uuids.append(value)
+            elif isinstance(value, str) and len(value) == 22:
+                values[index] = value[2:]
+        for index, string in zip(indexes, batch.encode_many(uuids, pad_length=20)):
+            values[index] = string[2:] if len(string) == 22 else string
+        return values
+
+
+class LeanShortUUIDSerializerField(rest_framework.serializers.Field):
+    """Serializer field validating a ShortUUID in a single pass.
+
+    Unlike NativeShortUUIDSerializerField it has no CharField validators: the
+    whitespace is trimmed and the length checked, then decoding checks the
+    alphabet and the 128 bits range. Returns a ShortUUIDString, or the
+    ``uuid.UUID`` itself with ``return_uuid=True``.
+    """
+    default_error_messages = {
+        'invalid': _('Must be a valid short UUID.'),
+    }
+
+    def __init__(self, *, return_uuid=False, **kwargs):
+        self.return_uuid = return_uuid
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if not isinstance(data, str):
+            self.fail('invalid', value=data)
+        string = data.strip()
+        if len(string) != codec.LENGTH and len(string) != codec.LENGTH20:
+            self.fail('invalid', value=data)
+        try:
+            string, value = self.parse(string)
+        except ValueError:
+            self.fail('invalid', value=data)
+        if self.return_uuid:
+            return value
+        return ShortUUIDString(string, value)
+
+    def parse(self, string):
+        return string, codec.uuid_from_int(codec.string_to_int(string))
+
+    to_representation = NativeShortUUIDSerializerField.to_representation
+    to_representation_many = NativeShortUUIDSerializerField.to_representation_many
+
+
+class LeanShortUUID20SerializerField(LeanShortUUIDSerializerField):
+    def parse(self, string):
+        number = codec.string_to_int(string)
+        if len(string) == codec.LENGTH:
+            # Always trim the first 2 chars of a 22-chars shortuuid, the last 20 chars are the remainder
+            string = string[2:]
+            number %= codec.MAX_INT20 + 1
+        return string, codec.uuid_from_int(number)
 
-class NativeShortUUIDField(django.db.models.UUIDField):
+    to_representation = NativeShortUUID20SerializerField.to_representation
+    to_representation_many = NativeShortUUID20SerializerField.to_representation_many
+
+
+def get_references(model, field):
+    """Return the (model, field) of the field and of all the foreign keys pointing to it, recursively.
+
+    A foreign key which is the primary key of its model, e.g. a multi-table
+    inheritance parent link, changes with it, so do the foreign keys to it.
+    """
+    references = [(model, field)]
+    for relation in model._meta.get_fields(include_hidden=True):
+        if relation.auto_created and not relation.concrete and (relation.one_to_many or relation.one_to_one) and \
+                relation.field.target_field == field:
+            related_model = relation.related_model
+            if related_model._meta.proxy:
+                continue
+            if relation.field.primary_key:
+                references.extend(get_references(related_model, relation.field))
+            else:
+                references.append((related_model, relation.field))
+    return references
+
+
+STORAGE_UUID = 'uuid'
+STORAGE_BINARY = 'binary'
+
+# Column types of the binary storage on the databases without a native uuid type
+BINARY_DB_TYPES = {
+    'mysql': 'binary(16)',
+    'oracle': 'RAW(16)',
+    'sqlite': 'BLOB',
+}
+
+
+class UUIDStorageMixin:
+    """Storage option of the native ShortUUID model fields.
+
+    With ``storage='binary'`` the databases without a native uuid type store the
+    16 bytes of the UUID, e.g. ``binary(16)`` on MySQL, instead of its 32 hex
+    chars. Databases with a native uuid type use it in both cases.
+    """
+
+    def __init__(self, *args, storage=STORAGE_UUID, **kwargs):
+        if storage not in (STORAGE_UUID, STORAGE_BINARY, ):
+            raise ValueError(f'storage must be {STORAGE_UUID!r} or {STORAGE_BINARY!r}')
+        self.storage = storage
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.storage != STORAGE_UUID:
+            kwargs['storage'] = self.storage
+        return name, path, args, kwargs
+
+    def get_internal_type(self):
+        # Keeps the backends from applying their uuid converters to the bytes
+        if self.storage == STORAGE_BINARY:
+            return 'BinaryField'
+        return super().get_internal_type()
+
+    def db_type(self, connection):
+        if self.storage == STORAGE_BINARY:
+            if connection.features.has_native_uuid_field:
+                return connection.data_types['UUIDField']
+            return BINARY_DB_TYPES.get(connection.vendor, connection.data_types['BinaryField'])
+        return super().db_type(connection)
+
+    def get_raw_output_field(self):
+        """Return the output field reading the raw UUIDs of the column, e.g. for ``ExpressionWrapper``.
+
+        The binary columns are read as bytes, see ``codec.uuids_from_bytes``: the
+        UUIDField converters of the backends expect hex chars.
+        """
+        if self.storage == STORAGE_BINARY:
+            return django.db.models.BinaryField()
+        return django.db.models.UUIDField()
+
+    def uses_binary_storage(self, connection):
+        return self.storage == STORAGE_BINARY and not connection.features.has_native_uuid_field
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if not self.uses_binary_storage(connection):
+            return super().get_db_prep_value(value, connection, prepared)
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = self.to_python(value)
+        return value.bytes
+
+
+class NativeShortUUIDField(UUIDStorageMixin, django.db.models.UUIDField):
     default_error_messages = {
         'invalid': _('“%(value)s” is not a valid ShortUUID.'),
     }
 
-    def __init__(self, verbose_name=None, **kwargs):
+    def __init__(self, verbose_name=None, *, lazy=False, **kwargs):
+        self.lazy = lazy
         self.default_value = kwargs.get('default', None)
-        if self.default_value is uuid.uuid4:
-            kwargs['default'] = short_uuid4
+        shortuuid_default = _get_shortuuid_default(self.default_value, SHORTUUID_DEFAULTS)
+        if shortuuid_default is not None:
+            kwargs['default'] = shortuuid_default
         super().__init__(verbose_name, **kwargs)
 
     def deconstruct(self):
         name, path, args, kwargs = super().deconstruct()
-        if self.default_value is uuid.uuid4:
-            kwargs['default'] = uuid.uuid4
+        if _get_shortuuid_default(self.default_value, SHORTUUID_DEFAULTS) is not None:
+            kwargs['default'] = self.default_value
+        if self.lazy:
+            kwargs['lazy'] = True
         return name, path, args, kwargs
 
     def from_db_value(self, value, expression, connection):
         if value is None:
             return value
-        return shortuuid.encode(value)
+        if not isinstance(value, uuid.UUID):
+            # Binary storage
+            value = codec.uuid_from_int(int.from_bytes(value, 'big'))
+        if self.lazy:
+            return LazyShortUUID(value)
+        return shortuuid_cache.encode(value)
+
+    def get_prep_value(self, value):
+        if isinstance(value, LazyShortUUID):
+            # Skips the cast of the Promise to its string
+            return value.uuid
+        return super().get_prep_value(value)
 
     def to_python(self, value):
+        if isinstance(value, (ShortUUIDString, LazyShortUUID, )):
+            # Values produced by the field itself already know their UUID
+            return value.uuid
         if value is not None and not isinstance(value, uuid.UUID):
             try:
-                return decode(value)
+                return shortuuid_cache.decode(value)
             except ValueError:
                 raise ValidationError(
                     self.error_messages['invalid'],
@@ -176,37 +431,50 @@ class NativeShortUUIDField(django.db.models.UUIDField):
         })
 
 
-class NativeShortUUID20Field(django.db.models.UUIDField):
+class NativeShortUUID20Field(UUIDStorageMixin, django.db.models.UUIDField):
     default_error_messages = {
         'invalid': _('“%(value)s” is not a valid ShortUUID.'),
     }
 
-    def __init__(self, verbose_name=None, **kwargs):
+    def __init__(self, verbose_name=None, *, lazy=False, **kwargs):
+        self.lazy = lazy
         self.default_value = kwargs.get('default', None)
-        if self.default_value is uuid4_12bits_masked:
-            kwargs['default'] = short_uuid4_20
+        shortuuid_default = _get_shortuuid_default(self.default_value, SHORTUUID20_DEFAULTS)
+        if shortuuid_default is not None:
+            kwargs['default'] = shortuuid_default
         super().__init__(verbose_name, **kwargs)
 
     def deconstruct(self):
         name, path, args, kwargs = super().deconstruct()
-        if self.default_value is uuid4_12bits_masked:
-            kwargs['default'] = uuid4_12bits_masked
+        if _get_shortuuid_default(self.default_value, SHORTUUID20_DEFAULTS) is not None:
+            kwargs['default'] = self.default_value
+        if self.lazy:
+            kwargs['lazy'] = True
         return name, path, args, kwargs
 
     def from_db_value(self, value, expression, connection):
         if value is None:
             return value
-        shortuuid_value = shortuuid.encode(value, pad_length=20)
-        if len(shortuuid_value) > 20:
-            # If the resulted shortuuid did not fit in 20 chars,
-            # then this is an old uuid which should result in 22 chars instead.
-            shortuuid_value = shortuuid.encode(value, pad_length=22)
-        return shortuuid_value
+        if not isinstance(value, uuid.UUID):
+            # Binary storage
+            value = codec.uuid_from_int(int.from_bytes(value, 'big'))
+        if self.lazy:
+            return LazyShortUUID20(value)
+        return shortuuid20_cache.encode(value)
+
+    def get_prep_value(self, value):
+        if isinstance(value, LazyShortUUID):
+            # Skips the cast of the Promise to its string
+            return value.uuid
+        return super().get_prep_value(value)
 
     def to_python(self, value):
+        if isinstance(value, (ShortUUIDString, LazyShortUUID, )):
+            # Values produced by the field itself already know their UUID
+            return value.uuid
         if value is not None and not isinstance(value, uuid.UUID):
             try:
-                return decode(value)
+                return shortuuid20_cache.decode(value)
             except ValueError:
                 raise ValidationError(
                     self.error_messages['invalid'],
@@ -220,3 +488,11 @@ class NativeShortUUID20Field(django.db.models.UUIDField):
             'form_class': NativeShortUUID20FormField,
             **kwargs,
         })
+
+
+NativeShortUUIDField.register_lookup(lookups.ShortUUIDStartsWith)
+NativeShortUUIDField.register_lookup(lookups.ShortUUIDIn)
+NativeShortUUIDField.register_lookup(lookups.ShortUUIDExact)
+NativeShortUUID20Field.register_lookup(lookups.ShortUUID20StartsWith)
+NativeShortUUID20Field.register_lookup(lookups.ShortUUIDIn)
+NativeShortUUID20Field.register_lookup(lookups.ShortUUIDExact)
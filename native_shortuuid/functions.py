@@ -0,0 +1,140 @@
+"""Database functions converting between UUID columns and ShortUUIDs.
+
+``ShortUUIDEncode`` and ``ShortUUIDDecode`` let the database do the base-57
+conversion, e.g. for ``.values()`` over millions of rows. On PostgreSQL the SQL
+functions are installed by the ``install_shortuuid_functions`` management
+command (or ``RunSQL(INSTALL_SQL, UNINSTALL_SQL)`` in a migration); on SQLite
+they are registered on every new connection.
+"""
+import uuid
+
+import django.db.models
+
+from . import codec
+
+ENCODE_FUNCTION = 'native_shortuuid_encode'
+DECODE_FUNCTION = 'native_shortuuid_decode'
+# SQLite only, for the fields with storage='binary'
+DECODE_BYTES_FUNCTION = 'native_shortuuid_decode_bytes'
+
+INSTALL_SQL = f"""
+CREATE OR REPLACE FUNCTION {ENCODE_FUNCTION}(value uuid, pad_length integer DEFAULT 22) RETURNS text AS $$
+DECLARE
+    alphabet CONSTANT text := '{codec.ALPHABET}';
+    hex text := replace(value::text, '-', '');
+    number numeric := 0;
+    result text := '';
+BEGIN
+    FOR i IN 1..32 LOOP
+        number := number * 16 + position(substr(hex, i, 1) in '0123456789abcdef') - 1;
+    END LOOP;
+    WHILE number > 0 LOOP
+        result := substr(alphabet, mod(number, 57)::integer + 1, 1) || result;
+        number := div(number, 57);
+    END LOOP;
+    IF pad_length = 20 AND char_length(result) > 20 THEN
+        -- Old uuids which don't fit in 20 chars result in 22 chars instead.
+        pad_length := 22;
+    END IF;
+    RETURN lpad(result, greatest(pad_length, char_length(result)), '2');
+END;
+$$ LANGUAGE plpgsql IMMUTABLE STRICT PARALLEL SAFE;
+
+CREATE OR REPLACE FUNCTION {DECODE_FUNCTION}(value text) RETURNS uuid AS $$
+DECLARE
+    alphabet CONSTANT text := '{codec.ALPHABET}';
+    number numeric := 0;
+    digit integer;
+    hex text := '';
+BEGIN
+    IF char_length(value) NOT IN (20, 22) THEN
+        RAISE EXCEPTION 'Badly formed ShortUUID: %', value;
+    END IF;
+    FOR i IN 1..char_length(value) LOOP
+        digit := position(substr(value, i, 1) in alphabet) - 1;
+        IF digit < 0 THEN
+            RAISE EXCEPTION 'Badly formed ShortUUID: %', value;
+        END IF;
+        number := number * 57 + digit;
+    END LOOP;
+    IF number >= 2::numeric ^ 128 THEN
+        RAISE EXCEPTION 'Badly formed ShortUUID: %', value;
+    END IF;
+    FOR i IN 1..32 LOOP
+        hex := substr('0123456789abcdef', mod(number, 16)::integer + 1, 1) || hex;
+        number := div(number, 16);
+    END LOOP;
+    RETURN hex::uuid;
+END;
+$$ LANGUAGE plpgsql IMMUTABLE STRICT PARALLEL SAFE;
+"""
+
+UNINSTALL_SQL = f"""
+DROP FUNCTION IF EXISTS {ENCODE_FUNCTION}(uuid, integer);
+DROP FUNCTION IF EXISTS {DECODE_FUNCTION}(text);
+"""
+
+
+class ShortUUIDEncode(django.db.models.Func):
+    """The ShortUUID of a UUID expression, ``length`` is 22 or 20 (22 chars for values which don't fit)."""
+    function = ENCODE_FUNCTION
+    output_field = django.db.models.CharField()
+
+    def __init__(self, expression, length=codec.LENGTH, **extra):
+        if length not in (codec.LENGTH, codec.LENGTH20, ):
+            raise ValueError('length must be 22 or 20')
+        super().__init__(expression, django.db.models.Value(length), **extra)
+
+
+class ShortUUIDDecode(django.db.models.Func):
+    """The UUID of a ShortUUID expression.
+
+    Compared with a native field, e.g. ``filter(uuid=ShortUUIDDecode(...))``, the
+    field becomes its output field, so that it produces the bytes of the fields
+    with ``storage='binary'``.
+    """
+    function = DECODE_FUNCTION
+    output_field = django.db.models.UUIDField()
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        uses_binary_storage = getattr(self.output_field, 'uses_binary_storage', None)
+        if uses_binary_storage is not None and uses_binary_storage(connection):
+            extra_context['function'] = DECODE_BYTES_FUNCTION
+        return self.as_sql(compiler, connection, **extra_context)
+
+
+def _sqlite_encode(value, pad_length):
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        # Binary storage
+        value = codec.uuid_from_int(int.from_bytes(value, 'big'))
+    else:
+        value = uuid.UUID(hex=value)
+    if pad_length == codec.LENGTH20:
+        return codec.encode20(value)
+    return codec.encode(value, pad_length)
+
+
+def _sqlite_decode(value):
+    if value is None:
+        return None
+    if len(value) not in (codec.LENGTH, codec.LENGTH20, ):
+        raise ValueError('Badly formed ShortUUID')
+    return codec.decode(value).hex
+
+
+def _sqlite_decode_bytes(value):
+    if value is None:
+        return None
+    if len(value) not in (codec.LENGTH, codec.LENGTH20, ):
+        raise ValueError('Badly formed ShortUUID')
+    return codec.decode(value).bytes
+
+
+def register_sqlite_functions(sender, connection, **kwargs):
+    """connection_created receiver registering the SQLite implementation of the functions."""
+    if connection.vendor == 'sqlite':
+        connection.connection.create_function(ENCODE_FUNCTION, 2, _sqlite_encode, deterministic=True)
+        connection.connection.create_function(DECODE_FUNCTION, 1, _sqlite_decode, deterministic=True)
+        connection.connection.create_function(DECODE_BYTES_FUNCTION, 1, _sqlite_decode_bytes, deterministic=True)
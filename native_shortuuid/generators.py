@@ -0,0 +1,108 @@
+"""Random UUIDs drawn from pooled randomness.
+
+``os.urandom`` is called for blocks of ``BLOCK_SIZE`` bytes instead of once per
+UUID. Every thread has its own block, and a forked child process drops the
+blocks inherited from its parent so both never produce the same UUIDs.
+"""
+import os
+import threading
+import time
+
+from . import batch
+from .codec import uuid_from_int
+from .values import ShortUUIDString
+
+BLOCK_SIZE = 4096
+
+# Random UUIDs which fit in 20 chars ShortUUIDs have their 12 most significant bits cleared.
+MASK116 = (1 << 116) - 1
+
+# Version 4 and RFC 4122 variant bits, as set by uuid.UUID(version=4).
+_CLEAR = ~((0xc000 << 48) | (0xf000 << 64))
+_SET = (0x8000 << 48) | (4 << 76)
+
+# Version 7 UUIDs: 48 bits of Unix time in milliseconds, version, 12 random bits, variant, 62 random bits.
+_RANDOM7 = (0xfff << 64) | ((1 << 62) - 1)
+_SET7 = (7 << 76) | (0x8000 << 48)
+_RANDOM62 = (1 << 62) - 1
+
+
+class _Pool(threading.local):
+    def __init__(self):
+        self.block = b''
+        self.offset = BLOCK_SIZE
+
+
+_pool = _Pool()
+
+
+def _reset_pool():
+    global _pool
+    _pool = _Pool()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_pool)
+
+
+def _random_bytes(size):
+    pool = _pool
+    offset = pool.offset
+    if offset + size > BLOCK_SIZE:
+        if size > BLOCK_SIZE:
+            return os.urandom(size)
+        pool.block = os.urandom(BLOCK_SIZE)
+        offset = 0
+    pool.offset = offset + size
+    return pool.block[offset:offset + size]
+
+
+def uuid4_int():
+    """Return the 128-bit integer of a random version 4 UUID."""
+    return (int.from_bytes(_random_bytes(16), 'big') & _CLEAR) | _SET
+
+
+def uuid4_ints(count):
+    """Return the 128-bit integers of ``count`` random version 4 UUIDs."""
+    data = _random_bytes(count * 16)
+    from_bytes = int.from_bytes
+    return [(from_bytes(data[offset:offset + 16], 'big') & _CLEAR) | _SET for offset in range(0, count * 16, 16)]
+
+
+def uuid7_int():
+    """Return the 128-bit integer of a version 7 UUID, ordered by its millisecond timestamp."""
+    milliseconds = time.time_ns() // 1000000
+    return (milliseconds << 80) | (int.from_bytes(_random_bytes(10), 'big') & _RANDOM7) | _SET7
+
+
+def uuid7_116bits_int():
+    """Return the 128-bit integer of a version 7 style UUID fitting in 116 bits.
+
+    The 12 most significant bits are cleared like in ``uuid4_12bits_masked``: the
+    36 high bits of the timestamp come first, then the version and the 12 low bits
+    of the timestamp in place of the 12 random bits, so the UUIDs keep the order
+    of their timestamps with 62 random bits.
+    """
+    milliseconds = time.time_ns() // 1000000
+    return (
+        ((milliseconds >> 12) << 80) | ((milliseconds & 0xfff) << 64) |
+        (int.from_bytes(_random_bytes(8), 'big') & _RANDOM62) | _SET7
+    )
+
+
+def generate_many(count, length=22):
+    """Return ``count`` random ShortUUIDs, e.g. for the objects of a ``bulk_create``.
+
+    With ``length=20`` the UUIDs have their 12 most significant bits cleared like
+    ``uuid4_12bits_masked``. The ShortUUIDs are ShortUUIDStrings, which the fields
+    save without decoding them.
+    """
+    if length not in (20, 22, ):
+        raise ValueError('length must be 20 or 22')
+    ints = uuid4_ints(count)
+    if length == 20:
+        values = [uuid_from_int(value & MASK116) for value in ints]
+    else:
+        values = [uuid_from_int(value) for value in ints]
+    strings = batch.encode_many(values, pad_length=length)
+    return [ShortUUIDString(string, value) for string, value in zip(strings, values)]
@@ -0,0 +1,135 @@
+import uuid
+
+import django.db.models
+from django.core.exceptions import EmptyResultSet
+from django.db.models.lookups import Exact
+from django.db.models.lookups import In
+
+from . import batch
+from . import codec
+from .functions import ShortUUIDDecode
+from .values import LazyShortUUID
+from .values import ShortUUIDString
+
+
+class ShortUUIDStartsWith(django.db.models.Lookup):
+    """Match the values whose ShortUUID starts with the given prefix.
+
+    The prefix is translated into UUID ranges, so the lookup compiles to
+    ``field >= low AND field <= high`` which can use the index of the column.
+    Invalid prefixes match nothing.
+    """
+    lookup_name = 'shortuuid_startswith'
+    prepare_rhs = False
+
+    def get_prep_lookup(self):
+        if hasattr(self.rhs, 'resolve_expression'):
+            raise ValueError(f'The {self.lookup_name} lookup only supports literal prefixes.')
+        return self.rhs
+
+    def get_ranges(self):
+        prefix_range = codec.prefix_range(self.rhs)
+        return [prefix_range] if prefix_range else []
+
+    def as_sql(self, compiler, connection):
+        ranges = self.get_ranges()
+        if not ranges:
+            raise EmptyResultSet
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        field = self.lhs.output_field
+        sql = []
+        params = []
+        for low, high in ranges:
+            sql.append(f'({lhs_sql} >= %s AND {lhs_sql} <= %s)')
+            params.extend(lhs_params)
+            params.append(field.get_db_prep_value(uuid.UUID(int=low), connection))
+            params.extend(lhs_params)
+            params.append(field.get_db_prep_value(uuid.UUID(int=high), connection))
+        return f'({" OR ".join(sql)})', params
+
+
+class ShortUUID20StartsWith(ShortUUIDStartsWith):
+    def get_ranges(self):
+        ranges = []
+        prefix_range = codec.prefix_range(self.rhs, codec.LENGTH20)
+        if prefix_range:
+            ranges.append(prefix_range)
+        # Old uuids which don't fit in 20 chars are rendered with 22 chars
+        prefix_range = codec.prefix_range(self.rhs)
+        if prefix_range and prefix_range[1] > codec.MAX_INT20:
+            ranges.append((max(prefix_range[0], codec.MAX_INT20 + 1), prefix_range[1]))
+        return ranges
+
+
+class ShortUUIDExact(Exact):
+    """``exact`` lookup giving its field to a ShortUUIDDecode right-hand side, see ShortUUIDDecode."""
+
+    def get_prep_lookup(self):
+        if isinstance(self.rhs, ShortUUIDDecode) and type(self.rhs.output_field) is django.db.models.UUIDField:
+            self.rhs = self.rhs.copy()
+            self.rhs.output_field = self.lhs.output_field
+        return super().get_prep_lookup()
+
+
+class ShortUUIDIn(In):
+    """``in`` lookup decoding all the ShortUUIDs of the list in a single batch.
+
+    The list is de-duplicated and bound as a single array parameter on
+    PostgreSQL. On the backends limiting the number of query parameters, e.g.
+    SQLite, longer lists are inlined as hex (or blob) literals, which is safe
+    since they are produced from the decoded UUIDs.
+    """
+    # Number of values per IN (...) when the values are inlined.
+    inline_chunk_size = 1000
+
+    def get_prep_lookup(self):
+        if hasattr(self.rhs, 'resolve_expression') or not self.prepare_rhs:
+            return super().get_prep_lookup()
+        values = list(self.rhs)
+        if any(hasattr(value, 'resolve_expression') for value in values):
+            self.rhs = values
+            return super().get_prep_lookup()
+
+        uuids = []
+        strings = []
+        for value in values:
+            if value is None:
+                continue
+            if isinstance(value, (ShortUUIDString, LazyShortUUID, )):
+                uuids.append(value.uuid)
+            elif isinstance(value, uuid.UUID):
+                uuids.append(value)
+            else:
+                strings.append(value)
+        if strings:
+            try:
+                uuids.extend(batch.decode_many(strings))
+            except batch.ShortUUIDBatchError as e:
+                # Raise the field's own ValidationError for the first invalid value
+                self.lhs.output_field.to_python(strings[min(e.errors)])
+                raise
+        return list(dict.fromkeys(uuids))
+
+    def as_sql(self, compiler, connection):
+        if not self.rhs_is_direct_value() or self.bilateral_transforms:
+            return super().as_sql(compiler, connection)
+        if not self.rhs:
+            raise EmptyResultSet
+
+        if connection.vendor == 'postgresql':
+            lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+            return f'{lhs_sql} = ANY(%s::uuid[])', (*lhs_params, list(self.rhs))
+
+        max_query_params = connection.features.max_query_params
+        if max_query_params and len(self.rhs) > max_query_params and not connection.features.has_native_uuid_field:
+            lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+            if self.lhs.output_field.uses_binary_storage(connection):
+                hex_values = [f"X'{value.hex}'" for value in self.rhs]
+            else:
+                hex_values = [f"'{value.hex}'" for value in self.rhs]
+            sql = [
+                f'{lhs_sql} IN ({", ".join(hex_values[offset:offset + self.inline_chunk_size])})'
+                for offset in range(0, len(hex_values), self.inline_chunk_size)
+            ]
+            return f'({" OR ".join(sql)})', list(lhs_params) * len(sql)
+        return super().as_sql(compiler, connection)
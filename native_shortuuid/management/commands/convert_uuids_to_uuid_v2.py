@@ -0,0 +1,109 @@
+import time
+
+import django.apps
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import DEFAULT_DB_ALIAS
+from django.db import connections
+from django.db import transaction
+from django.db.models import Case
+from django.db.models import ExpressionWrapper
+from django.db.models import F
+from django.db.models import Value
+from django.db.models import When
+
+from native_shortuuid import codec
+from native_shortuuid.fields import NativeShortUUID20Field
+from native_shortuuid.fields import convert_uuids_to_uuid_v2
+from native_shortuuid.fields import get_references
+
+
+class Command(BaseCommand):
+    help = (
+        'Convert the legacy UUIDs of a NativeShortUUID20Field which need 22 chars to their 20 chars form '
+        '(see convert_uuid_to_uuid_v2), together with the foreign keys pointing to them. '
+        'Only the legacy values are selected, so an interrupted conversion resumes where it stopped.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('model', help='The model to convert, as app_label.ModelName.')
+        parser.add_argument('--field', help='The NativeShortUUID20Field to convert. Defaults to the primary key.')
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Number of rows converted per transaction, at most a third of the query parameters the database allows.',
+        )
+        parser.add_argument(
+            '--database', default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to convert the rows of. Defaults to the "default" database.',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Only count the rows to convert.')
+
+    def handle(self, *args, **options):
+        try:
+            model = django.apps.apps.get_model(options['model'])
+        except (LookupError, ValueError) as e:
+            raise CommandError(e)
+        field = model._meta.get_field(options['field']) if options['field'] else model._meta.pk
+        if not isinstance(field, NativeShortUUID20Field):
+            raise CommandError(f'{model._meta.label}.{field.name} is not a NativeShortUUID20Field.')
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be a positive integer.')
+
+        database = options['database']
+        # The 20 chars UUIDs are the ones up to MAX_INT20, the legacy ones are above
+        legacy = model._base_manager.using(database).filter(**{f'{field.name}__gt': codec.uuid_from_int(codec.MAX_INT20)})
+        references = get_references(model, field)
+        if options['dry_run']:
+            self.stdout.write(f'{legacy.count()} rows to convert, referenced by {len(references) - 1} foreign key(s).')
+            return
+
+        connection = connections[database]
+        batch_size = options['batch_size']
+        max_query_params = connection.features.max_query_params
+        if max_query_params:
+            # Every value is a parameter of the IN (...) and two of the CASE WHEN ... THEN ...
+            batch_size = min(batch_size, max_query_params // 3)
+        # Read the raw UUIDs, not the ShortUUIDs which would be decoded again
+        column = ExpressionWrapper(F(field.name), output_field=field.get_raw_output_field())
+        converted = 0
+        last_value = None
+        start = time.monotonic()
+        while True:
+            queryset = legacy if last_value is None else legacy.filter(**{f'{field.name}__gt': last_value})
+            values = codec.uuids_from_bytes(queryset.order_by(field.name).values_list(column, flat=True)[:batch_size])
+            if not values:
+                break
+            new_values = convert_uuids_to_uuid_v2(values)
+            with transaction.atomic(using=database):
+                if connection.vendor == 'mysql':
+                    # MySQL checks the foreign keys on every statement, the rows are consistent at the end of the batch
+                    with connection.cursor() as cursor:
+                        cursor.execute('SET FOREIGN_KEY_CHECKS = 0')
+                try:
+                    for reference_model, reference_field in references:
+                        self.update(reference_model, reference_field, values, new_values, database)
+                finally:
+                    if connection.vendor == 'mysql':
+                        with connection.cursor() as cursor:
+                            cursor.execute('SET FOREIGN_KEY_CHECKS = 1')
+            converted += len(values)
+            last_value = values[-1]
+            elapsed = time.monotonic() - start
+            self.stdout.write(f'{converted} rows converted ({converted / elapsed if elapsed else 0:.0f} rows/s)')
+
+        elapsed = time.monotonic() - start
+        self.stdout.write(self.style.SUCCESS(
+            f'Converted {converted} rows of {model._meta.label} in {elapsed:.1f}s '
+            f'({converted / elapsed if elapsed else 0:.0f} rows/s).'
+        ))
+
+    def update(self, model, field, values, new_values, database):
+        """Replace the values by the new ones in the column of the field, with a single UPDATE."""
+        target_field = field.target_field if field.is_relation else field
+        cases = [
+            When(**{field.attname: value}, then=Value(new_value, output_field=target_field))
+            for value, new_value in zip(values, new_values)
+        ]
+        model._base_manager.using(database).filter(**{f'{field.attname}__in': values}).update(
+            **{field.attname: Case(*cases, output_field=target_field)},
+        )
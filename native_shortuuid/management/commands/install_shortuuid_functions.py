@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import DEFAULT_DB_ALIAS
+from django.db import connections
+
+from native_shortuuid import functions
+
+
+class Command(BaseCommand):
+    help = 'Install the SQL functions used by ShortUUIDEncode and ShortUUIDDecode (PostgreSQL only).'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--database', default=DEFAULT_DB_ALIAS,
+            help='Nominates a database to install the functions on. Defaults to the "default" database.',
+        )
+        parser.add_argument('--uninstall', action='store_true', help='Drop the functions instead.')
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+        if connection.vendor == 'sqlite':
+            self.stdout.write('Nothing to install: the functions are registered on every SQLite connection.')
+            return
+        if connection.vendor != 'postgresql':
+            raise CommandError(f'The ShortUUID SQL functions are not available on {connection.vendor}.')
+
+        with connection.cursor() as cursor:
+            cursor.execute(functions.UNINSTALL_SQL if options['uninstall'] else functions.INSTALL_SQL)
+        action = 'Dropped' if options['uninstall'] else 'Installed'
+        self.stdout.write(self.style.SUCCESS(f'{action} {functions.ENCODE_FUNCTION} and {functions.DECODE_FUNCTION}.'))
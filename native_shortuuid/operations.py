@@ -0,0 +1,76 @@
+"""Migration operations for the native ShortUUID fields."""
+from django.db import NotSupportedError
+from django.db import migrations
+
+from .fields import STORAGE_BINARY
+from .fields import get_references
+
+SQLITE_UNHEX_FUNCTION = 'native_shortuuid_unhex'
+
+
+def _sqlite_unhex(value):
+    if isinstance(value, str):
+        return bytes.fromhex(value)
+    return value
+
+
+class AlterUUIDStorage(migrations.AlterField):
+    """AlterField converting the stored values when the ``storage`` of a native ShortUUID field changes.
+
+    On the databases without a native uuid type, the values of the column and
+    of the foreign keys pointing to it are converted between the 32 hex chars
+    and the 16 bytes of the UUIDs. Supports SQLite and MySQL.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        connection = schema_editor.connection
+        from_model = from_state.apps.get_model(app_label, self.model_name)
+        to_model = to_state.apps.get_model(app_label, self.model_name)
+        old_field = from_model._meta.get_field(self.name)
+        new_field = to_model._meta.get_field(self.name)
+        old_binary = getattr(old_field, 'storage', None) == STORAGE_BINARY
+        to_binary = getattr(new_field, 'storage', None) == STORAGE_BINARY
+        if old_binary == to_binary or connection.features.has_native_uuid_field or \
+                not self.allow_migrate_model(connection.alias, to_model):
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+        columns = [
+            (model._meta.db_table, field.column, field.null) for model, field in get_references(from_model, old_field)
+        ]
+        quote_name = schema_editor.quote_name
+        if connection.vendor == 'sqlite':
+            # The tables are rebuilt with the values copied as they are, convert them afterwards
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+            if to_binary:
+                connection.ensure_connection()
+                connection.connection.create_function(SQLITE_UNHEX_FUNCTION, 1, _sqlite_unhex, deterministic=True)
+            for table, column, null in columns:
+                if to_binary:
+                    schema_editor.execute(
+                        f'UPDATE {quote_name(table)} SET {quote_name(column)} = '
+                        f'{SQLITE_UNHEX_FUNCTION}({quote_name(column)}) WHERE typeof({quote_name(column)}) = \'text\''
+                    )
+                else:
+                    schema_editor.execute(
+                        f'UPDATE {quote_name(table)} SET {quote_name(column)} = '
+                        f'lower(hex({quote_name(column)})) WHERE typeof({quote_name(column)}) = \'blob\''
+                    )
+        elif connection.vendor == 'mysql':
+            # Convert the values in varbinary(32) columns, which hold both forms, then change the column types
+            schema_editor.execute('SET FOREIGN_KEY_CHECKS = 0')
+            try:
+                for table, column, null in columns:
+                    schema_editor.execute(
+                        f'ALTER TABLE {quote_name(table)} MODIFY {quote_name(column)} varbinary(32)'
+                        f'{"" if null else " NOT NULL"}'
+                    )
+                    expression = f'UNHEX({quote_name(column)})' if to_binary else f'LOWER(HEX({quote_name(column)}))'
+                    schema_editor.execute(f'UPDATE {quote_name(table)} SET {quote_name(column)} = {expression}')
+                super().database_forwards(app_label, schema_editor, from_state, to_state)
+            finally:
+                schema_editor.execute('SET FOREIGN_KEY_CHECKS = 1')
+        else:
+            raise NotSupportedError(f'{self.__class__.__name__} does not support {connection.display_name}.')
+
+    def describe(self):
+        return f'Alter storage of field {self.name} on {self.model_name}'
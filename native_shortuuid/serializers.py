@@ -0,0 +1,135 @@
+"""DRF serializers converting the ShortUUIDs of a whole list at once."""
+import django.db.models
+
+import rest_framework.relations
+import rest_framework.serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+from .fields import LeanShortUUID20SerializerField
+from .fields import LeanShortUUIDSerializerField
+from .fields import NativeShortUUID20Field
+from .fields import NativeShortUUID20SerializerField
+from .fields import NativeShortUUIDField
+from .fields import NativeShortUUIDSerializerField
+
+SHORTUUID_SERIALIZER_FIELDS = (
+    NativeShortUUIDSerializerField, NativeShortUUID20SerializerField,
+    LeanShortUUIDSerializerField, LeanShortUUID20SerializerField,
+)
+
+_SKIP = object()
+
+
+def _defining_class(cls, name):
+    for klass in cls.__mro__:
+        if name in vars(klass):
+            return klass
+    return None
+
+
+def _has_representation_many(field):
+    """Return whether to_representation_many renders the values like the to_representation of the field.
+
+    A subclass overriding ``to_representation`` without its own
+    ``to_representation_many`` is rendered value by value.
+    """
+    cls = type(field)
+    many_class = _defining_class(cls, 'to_representation_many')
+    return many_class is not None and issubclass(many_class, _defining_class(cls, 'to_representation'))
+
+
+def _get_shortuuid_column(field, instances):
+    """Return the representations of a ShortUUID field of all the instances, or None for the other fields."""
+    if isinstance(field, SHORTUUID_SERIALIZER_FIELDS):
+        shortuuid_field = field
+    elif isinstance(field, rest_framework.relations.PrimaryKeyRelatedField) and \
+            isinstance(field.pk_field, SHORTUUID_SERIALIZER_FIELDS):
+        shortuuid_field = field.pk_field
+    else:
+        return None
+    if not _has_representation_many(shortuuid_field):
+        return None
+
+    values = []
+    append = values.append
+    for instance in instances:
+        try:
+            attribute = field.get_attribute(instance)
+        except SkipField:
+            append(_SKIP)
+            continue
+        if shortuuid_field is not field and attribute is not None:
+            attribute = attribute.pk
+        append(attribute)
+    return shortuuid_field.to_representation_many(values)
+
+
+class ShortUUIDListSerializer(rest_framework.serializers.ListSerializer):
+    """ListSerializer converting the ShortUUIDs of all the objects of the list at once.
+
+    The ShortUUID serializer fields of the child, and its primary key related
+    fields with a ShortUUID ``pk_field``, are read for the whole list and
+    converted in one batch. The other fields are serialized as usual, and a
+    child overriding ``to_representation`` object by object.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, django.db.models.manager.BaseManager) else data
+        child = self.child
+        if type(child).to_representation is not rest_framework.serializers.Serializer.to_representation:
+            return [child.to_representation(item) for item in iterable]
+
+        instances = list(iterable)
+        fields = [(field, _get_shortuuid_column(field, instances)) for field in child._readable_fields]
+        representations = []
+        for index, instance in enumerate(instances):
+            ret = {}
+            for field, column in fields:
+                if column is not None:
+                    value = column[index]
+                    if value is not _SKIP:
+                        ret[field.field_name] = value
+                    continue
+                try:
+                    attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+                check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+                if check_for_none is None:
+                    ret[field.field_name] = None
+                else:
+                    ret[field.field_name] = field.to_representation(attribute)
+            representations.append(ret)
+        return representations
+
+
+class ShortUUIDModelSerializerMixin:
+    """ModelSerializer mixin for the models with ShortUUID fields.
+
+    The ShortUUID model fields get the ShortUUID serializer fields, the foreign
+    keys to them a ShortUUID ``pk_field``, and ``many=True`` a ShortUUIDListSerializer
+    unless ``Meta`` sets its own ``list_serializer_class``.
+    """
+    serializer_field_mapping = {
+        **rest_framework.serializers.ModelSerializer.serializer_field_mapping,
+        NativeShortUUIDField: NativeShortUUIDSerializerField,
+        NativeShortUUID20Field: NativeShortUUID20SerializerField,
+    }
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        meta = getattr(cls, 'Meta', None)
+        if meta is not None and not hasattr(meta, 'list_serializer_class'):
+            meta.list_serializer_class = ShortUUIDListSerializer
+
+    def build_relational_field(self, field_name, relation_info):
+        field_class, field_kwargs = super().build_relational_field(field_name, relation_info)
+        model_field = relation_info.model_field
+        if issubclass(field_class, rest_framework.relations.PrimaryKeyRelatedField) and \
+                isinstance(model_field, django.db.models.ForeignKey):
+            target_field = model_field.target_field
+            if isinstance(target_field, NativeShortUUID20Field):
+                field_kwargs.setdefault('pk_field', NativeShortUUID20SerializerField())
+            elif isinstance(target_field, NativeShortUUIDField):
+                field_kwargs.setdefault('pk_field', NativeShortUUIDSerializerField())
+        return field_class, field_kwargs
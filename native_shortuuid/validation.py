@@ -1,6 +1,9 @@
+import uuid
+
 from django.urls import register_converter
 
-import shortuuid
+from . import codec
+from .values import ShortUUIDString
 
 
 def validate_shortuuid(val):
@@ -8,11 +11,12 @@ def validate_shortuuid(val):
         raise ValueError('Must be of type str')
     if len(val) not in (20, 22, ):
         raise ValueError(f'Incorrect length: {len(val)}')
-    shortuuid.decode(val)
+    if not codec.is_valid(val):
+        raise ValueError('Badly formed ShortUUID')
 
 
 class ShortUUIDConverter:
-    regex = '[{}]{{20}}([{}]{{2}})?'.format(shortuuid.get_alphabet(), shortuuid.get_alphabet())
+    regex = '[{}]{{20}}([{}]{{2}})?'.format(codec.ALPHABET, codec.ALPHABET)
 
     def to_python(self, value):
         return value
@@ -22,7 +26,7 @@ class ShortUUIDConverter:
 
 
 class ShortUUID20Converter:
-    regex = '[{}]{{20}}([{}]{{2}})?'.format(shortuuid.get_alphabet(), shortuuid.get_alphabet())
+    regex = '[{}]{{20}}([{}]{{2}})?'.format(codec.ALPHABET, codec.ALPHABET)
 
     def to_python(self, value):
         if len(value) == 22:
@@ -35,5 +39,58 @@ class ShortUUID20Converter:
         return value
 
 
+def _character_class(chars):
+    """Return a regex character class of the sorted ``chars``, as ranges of consecutive chars."""
+    ranges = []
+    for char in chars:
+        if ranges and ord(char) == ord(ranges[-1][1]) + 1:
+            ranges[-1][1] = char
+        else:
+            ranges.append([char, char])
+    return '[{}]'.format(''.join(start if start == end else f'{start}-{end}' for start, end in ranges))
+
+
+_DIGIT = _character_class(codec.ALPHABET)
+# The first digit of a 22 chars ShortUUID can't be greater than the first digit of the largest UUID
+_FIRST_DIGIT22 = _character_class(codec.ALPHABET[:codec.ALPHABET.index(codec._MAX_STRING[0]) + 1])
+
+
+class DecodedShortUUIDConverter:
+    """Converter returning a ShortUUIDString, which carries its decoded ``uuid.UUID``.
+
+    The ORM lookups reuse the UUID instead of decoding the string again, and the
+    paths of ShortUUIDs overflowing 128 bits don't match.
+    """
+    regex = f'(?:{_FIRST_DIGIT22}{_DIGIT})?{_DIGIT}{{20}}'
+
+    def to_python(self, value):
+        return ShortUUIDString(value, codec.decode(value))
+
+    def to_url(self, value):
+        if isinstance(value, uuid.UUID):
+            return codec.encode(value)
+        return str(value)
+
+
+class DecodedShortUUID20Converter(DecodedShortUUIDConverter):
+    def to_python(self, value):
+        if len(value) == 22:
+            if not codec.is_valid(value):
+                raise ValueError('Badly formed ShortUUID')
+            value = value[2:]
+        return super().to_python(value)
+
+    def to_url(self, value):
+        if isinstance(value, uuid.UUID):
+            # Trimmed like a 22 chars string, a UUID with 21 significant digits would not match the regex
+            return codec.encode(value)[2:]
+        value = str(value)
+        if len(value) == 22:
+            value = value[2:]
+        return value
+
+
 register_converter(ShortUUIDConverter, 'shortuuid')
 register_converter(ShortUUID20Converter, 'shortuuid20')
+register_converter(DecodedShortUUIDConverter, 'decoded_shortuuid')
+register_converter(DecodedShortUUID20Converter, 'decoded_shortuuid20')
@@ -0,0 +1,116 @@
+"""Value types returned by the native ShortUUID fields."""
+from django.utils.functional import Promise
+
+from . import codec
+
+
+class ShortUUIDString(str):
+    """ShortUUID string which remembers the UUID it was encoded from.
+
+    The fields return it from the database and read ``uuid`` back instead of
+    decoding the string when it is saved or used in a lookup.
+    """
+
+    def __new__(cls, string, value):
+        self = str.__new__(cls, string)
+        self.uuid = value
+        return self
+
+    def __getnewargs__(self):
+        return str(self), self.uuid
+
+    @classmethod
+    def from_uuid(cls, value):
+        self = str.__new__(cls, codec.encode(value))
+        self.uuid = value
+        return self
+
+    @classmethod
+    def from_uuid20(cls, value):
+        self = str.__new__(cls, codec.encode20(value))
+        self.uuid = value
+        return self
+
+
+class LazyShortUUID(Promise):
+    """ShortUUID loaded from the database and only encoded when it is used.
+
+    It keeps the ``uuid.UUID`` read from the database, which the fields save back
+    without decoding, and behaves like the ShortUUID string otherwise: it
+    compares, hashes, indexes and formats like it. Other str methods are
+    available on ``str(value)``. Like the lazy translations it is a Django
+    ``Promise``, which the JSON encoders of Django and DRF serialize as its string.
+    Promise has no ``__slots__``, so the instances have a ``__dict__``.
+    """
+
+    encode = staticmethod(codec.encode)
+
+    def __init__(self, value):
+        self.uuid = value
+        self._string = None
+
+    def __str__(self):
+        if self._string is None:
+            self._string = self.encode(self.uuid)
+        return self._string
+
+    # Cast of the Promise by Field.get_prep_value
+    _proxy____cast = __str__
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({str(self)!r})'
+
+    def __eq__(self, other):
+        # Equal to the same ShortUUID string only, so that equal values have the same hash
+        if isinstance(other, LazyShortUUID):
+            if other.encode is self.encode:
+                return self.uuid == other.uuid
+            return str(self) == str(other)
+        if isinstance(other, str):
+            return str(self) == other
+        return NotImplemented
+
+    def __lt__(self, other):
+        return str(self) < str(other)
+
+    def __le__(self, other):
+        return str(self) <= str(other)
+
+    def __gt__(self, other):
+        return str(self) > str(other)
+
+    def __ge__(self, other):
+        return str(self) >= str(other)
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __len__(self):
+        return len(str(self))
+
+    def __getitem__(self, key):
+        return str(self)[key]
+
+    def __iter__(self):
+        return iter(str(self))
+
+    def __contains__(self, item):
+        return item in str(self)
+
+    def __add__(self, other):
+        return str(self) + other
+
+    def __radd__(self, other):
+        return other + str(self)
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+    def __reduce__(self):
+        return self.__class__, (self.uuid, )
+
+
+class LazyShortUUID20(LazyShortUUID):
+    """LazyShortUUID encoded into 20 chars, or 22 chars for legacy UUIDs."""
+
+    encode = staticmethod(codec.encode20)
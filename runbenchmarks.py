@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""Run the benchmarks of the benchmarks package and print their results as JSON.
+
+    python runbenchmarks.py [--output results.json] [module ...]
+"""
+import argparse
+import datetime
+import importlib
+import json
+import platform
+import subprocess
+import sys
+
+import benchmarks
+
+MODULES = ['codec', 'generators', 'from_db_value20', 'queries', 'inserts', 'serializers', 'admin', 'urls']
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Run the native_shortuuid benchmarks.')
+    parser.add_argument('modules', nargs='*', default=MODULES, help='benchmark modules to run (default: all)')
+    parser.add_argument('--output', help='write the JSON results to this file instead of stdout')
+    args = parser.parse_args()
+
+    benchmarks.setup()
+    from native_shortuuid import codec
+
+    results = {
+        'revision': git_revision(),
+        'date': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'speedups': codec._speedups is not None,
+        'benchmarks': {},
+    }
+    for name in args.modules:
+        print(f'Running {name}...', file=sys.stderr)
+        results['benchmarks'][name] = importlib.import_module(f'benchmarks.{name}').run()
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
@@ -4,14 +4,6 @@ import sys
 import setuptools
 from setuptools.command.install import install
 
-VERSION = "1.4.11"
-
-
-def readme():
-    """print long description"""
-    with open('README.md') as f:
-        return f.read()
-
 
 class VerifyVersionCommand(install):
     """Custom command to verify that the git tag matches our version"""
@@ -19,45 +11,23 @@ class VerifyVersionCommand(install):
 
     def run(self):
         tag = os.getenv('CIRCLE_TAG')
+        version = self.distribution.get_version()
 
-        if tag != VERSION:
+        if tag != version:
             info = "Git tag: {0} does not match the version of this app: {1}".format(
-                tag, VERSION
+                tag, version
             )
             sys.exit(info)
 
 
+# The metadata of the package, including its version, is in pyproject.toml
 setuptools.setup(
-    name="django-nativeshortuuidfield",
-    version=VERSION,
-    description="A decoder/encoder Field for uuid",
-    long_description=readme(),
-    long_description_content_type='text/markdown',
-    url="https://github.com/foundertherapy/django-nativeshortuuidfield",
     include_package_data=True,
-    author="Laith Abu Zainih",
-    author_email="systems@foundertherapy.co",
-    license="MIT",
-    classifiers=[
-        "Development Status :: 5 - Production/Stable",
-        "Intended Audience :: Developers",
-        "License :: OSI Approved :: MIT License",
-        "Operating System :: OS Independent",
-        "Topic :: Software Development :: Build Tools",
-        "Topic :: Software Development :: Libraries :: Python Modules",
-        "Topic :: Internet",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3 :: Only",
-    ],
-    keywords='shortuuid uuid nativeshortuuid',
-    packages=setuptools.find_packages(),
-    install_requires=[
-        "django>=4.2",
-        "djangorestframework>=3.13.1",
-        "django-shortuuidfield"
+    packages=setuptools.find_packages(exclude=['benchmarks', 'benchmarks.*', 'tests', 'tests.*']),
+    ext_modules=[
+        # Optional accelerator for native_shortuuid.codec, the pure Python codec is used when it can't be built.
+        setuptools.Extension('native_shortuuid._speedups', ['native_shortuuid/_speedups.c'], optional=True),
     ],
-    python_requires='>=3.10',
     cmdclass={
         'verify': VerifyVersionCommand,
     }
@@ -51,3 +51,33 @@ class ShortUUIDGrandchild(ShortUUIDChild):
 
 class ShortUUID20Grandchild(ShortUUID20Child):
     pass
+
+
+class LazyShortUUIDModel(django.db.models.Model):
+    field = native_shortuuid.NativeShortUUIDField(lazy=True)
+
+
+class LazyShortUUID20Model(django.db.models.Model):
+    field = native_shortuuid.NativeShortUUID20Field(lazy=True)
+
+
+class OrderedShortUUIDModel(django.db.models.Model):
+    id = native_shortuuid.NativeShortUUIDField(primary_key=True, default=native_shortuuid.uuid7)
+
+
+class OrderedShortUUID20Model(django.db.models.Model):
+    id = native_shortuuid.NativeShortUUID20Field(primary_key=True, default=native_shortuuid.uuid7_116bits)
+
+
+class BinaryShortUUIDModel(django.db.models.Model):
+    id = native_shortuuid.NativeShortUUIDField(primary_key=True, default=uuid.uuid4, storage='binary')
+    field20 = native_shortuuid.NativeShortUUID20Field(null=True, storage='binary')
+
+
+class RelatedToBinaryShortUUIDModel(django.db.models.Model):
+    binary_fk = django.db.models.ForeignKey('BinaryShortUUIDModel', django.db.models.CASCADE)
+
+
+class ExternalUUIDModel(django.db.models.Model):
+    field = native_shortuuid.NativeShortUUIDField(null=True)
+    external_uuid = django.db.models.CharField(max_length=22, blank=True)
@@ -0,0 +1,231 @@
+import uuid
+from unittest import mock
+
+import django.test
+from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.test import RequestFactory
+
+import shortuuid
+from native_shortuuid import codec
+from native_shortuuid.admin import SEARCH_FIELDS_SPLIT_CACHE_SIZE
+from native_shortuuid.admin import NativeUUID20SearchMixin
+from native_shortuuid.admin import NativeUUIDChangeList
+from native_shortuuid.admin import NativeUUIDChangeListMixin
+from native_shortuuid.admin import NativeUUIDSearchMixin
+from native_shortuuid.admin import _split_search_fields
+from tests import models
+
+
+class ShortUUIDModelAdmin(NativeUUIDSearchMixin, admin.ModelAdmin):
+    search_fields = ('field', 'id', )
+
+
+class RelatedToShortUUIDModelAdmin(NativeUUIDSearchMixin, admin.ModelAdmin):
+    search_fields = ('=shortuuid_fk__id', 'shortuuid_fk', 'id', )
+
+
+class RelatedToShortUUID20ModelAdmin(NativeUUID20SearchMixin, admin.ModelAdmin):
+    search_fields = ('shortuuid_fk__id', 'id', )
+
+
+class TestSearchFields(django.test.SimpleTestCase):
+    def setUp(self):
+        self.request = RequestFactory().get('/')
+
+    def test_split(self):
+        model_admin = ShortUUIDModelAdmin(models.ShortUUIDModel, admin.site)
+        self.assertEqual(model_admin.get_search_fields(self.request), ['id'])
+        self.assertEqual(model_admin.get_search_uuid_fields(self.request), ('field', ))
+        self.assertEqual(ShortUUIDModelAdmin.search_uuid_fields, [])
+
+    def test_split_cache_bounded(self):
+        class DynamicSearchFieldsAdmin(admin.ModelAdmin):
+            def get_search_fields(self, request):
+                return ('field', f'name{request.GET["n"]}', )
+
+        class ModelAdmin(NativeUUIDSearchMixin, DynamicSearchFieldsAdmin):
+            pass
+
+        model_admin = ModelAdmin(models.ShortUUIDModel, admin.site)
+        for n in range(SEARCH_FIELDS_SPLIT_CACHE_SIZE + 10):
+            self.assertEqual(model_admin.get_search_uuid_fields(RequestFactory().get('/', {'n': n})), ('field', ))
+        self.assertEqual(_split_search_fields.cache_info().currsize, SEARCH_FIELDS_SPLIT_CACHE_SIZE)
+
+    def test_related(self):
+        model_admin = RelatedToShortUUIDModelAdmin(models.RelatedToShortUUIDModel, admin.site)
+        self.assertEqual(model_admin.get_search_uuid_fields(self.request), ('shortuuid_fk__id', 'shortuuid_fk', ))
+        self.assertEqual(model_admin.get_search_fields(self.request), ['id'])
+
+        model_admin = RelatedToShortUUID20ModelAdmin(models.RelatedToShortUUID20Model, admin.site)
+        self.assertEqual(model_admin.get_search_uuid_fields(self.request), ('shortuuid_fk__id', ))
+
+    def test_20_ignores_22_fields(self):
+        class ModelAdmin(NativeUUID20SearchMixin, admin.ModelAdmin):
+            search_fields = ('field', )
+
+        model_admin = ModelAdmin(models.ShortUUIDModel, admin.site)
+        self.assertEqual(model_admin.get_search_uuid_fields(self.request), ())
+
+    def test_dynamic_search_fields(self):
+        class BaseModelAdmin(admin.ModelAdmin):
+            def get_search_fields(self, request):
+                return ('field', 'id', ) if request.GET.get('uuid') else ('id', )
+
+        class ModelAdmin(NativeUUIDSearchMixin, BaseModelAdmin):
+            pass
+
+        model_admin = ModelAdmin(models.ShortUUIDModel, admin.site)
+        request = RequestFactory().get('/', {'uuid': '1'})
+        self.assertEqual(model_admin.get_search_uuid_fields(request), ('field', ))
+        self.assertEqual(model_admin.get_search_uuid_fields(self.request), ())
+        self.assertEqual(model_admin.get_search_fields(self.request), ['id'])
+
+    def test_manual_uuid_fields(self):
+        class ModelAdmin(NativeUUIDSearchMixin, admin.ModelAdmin):
+            admin_auto_extract_uuid_search_fields = False
+            search_fields = ('id', )
+            search_uuid_fields = ['field']
+
+        model_admin = ModelAdmin(models.ShortUUIDModel, admin.site)
+        self.assertEqual(model_admin.get_search_fields(self.request), ['id'])
+        self.assertEqual(model_admin.get_search_uuid_fields(self.request), ('field', ))
+
+
+class TestSearchResults(django.test.TestCase):
+    def setUp(self):
+        self.request = RequestFactory().get('/')
+
+    def test_search(self):
+        obj = models.ShortUUIDModel.objects.create(field=uuid.uuid4())
+        models.ShortUUIDModel.objects.create(field=uuid.uuid4())
+        model_admin = ShortUUIDModelAdmin(models.ShortUUIDModel, admin.site)
+        queryset = models.ShortUUIDModel.objects.all()
+        results, _ = model_admin.get_search_results(self.request, queryset, codec.encode(obj.field))
+        self.assertEqual(list(results), [obj])
+        results, _ = model_admin.get_search_results(self.request, queryset, shortuuid.uuid())
+        self.assertEqual(list(results), [])
+
+    def test_search_related(self):
+        parent = models.PrimaryKeyShortUUIDModel.objects.create()
+        obj = models.RelatedToShortUUIDModel.objects.create(shortuuid_fk=parent)
+        model_admin = RelatedToShortUUIDModelAdmin(models.RelatedToShortUUIDModel, admin.site)
+        queryset, _ = model_admin.get_search_results(self.request, models.RelatedToShortUUIDModel.objects.all(), parent.pk)
+        self.assertEqual(list(queryset), [obj])
+
+    def test_search_short_circuit(self):
+        class ModelAdmin(NativeUUIDSearchMixin, admin.ModelAdmin):
+            search_fields = ('shortuuid_fk__id', 'shortuuid_fk', )
+            search_uuid_short_circuit = True
+
+        parent = models.PrimaryKeyShortUUIDModel.objects.create()
+        obj = models.RelatedToShortUUIDModel.objects.create(shortuuid_fk=parent)
+        model_admin = ModelAdmin(models.RelatedToShortUUIDModel, admin.site)
+        queryset = models.RelatedToShortUUIDModel.objects.all()
+        with self.assertNumQueries(2):
+            results, may_have_duplicates = model_admin.get_search_results(self.request, queryset, parent.pk)
+            self.assertEqual(list(results), [obj])
+        self.assertFalse(may_have_duplicates)
+        with self.assertNumQueries(2):
+            results, _ = model_admin.get_search_results(self.request, queryset, shortuuid.uuid())
+            self.assertEqual(list(results), [])
+
+    def test_search_hex(self):
+        obj = models.ShortUUIDModel.objects.create(field=uuid.uuid4())
+        model_admin = ShortUUIDModelAdmin(models.ShortUUIDModel, admin.site)
+        queryset = models.ShortUUIDModel.objects.all()
+        for term in (str(obj.field), obj.field.hex):
+            results, _ = model_admin.get_search_results(self.request, queryset, term)
+            self.assertEqual(list(results), [])
+
+        model_admin.search_uuid_accept_hex = True
+        for term in (str(obj.field), obj.field.hex, f' {obj.field} '):
+            results, _ = model_admin.get_search_results(self.request, queryset, term)
+            self.assertEqual(list(results), [obj])
+
+    def test_search_char_uuid_field(self):
+        class ModelAdmin(NativeUUIDSearchMixin, admin.ModelAdmin):
+            search_fields = ('field', 'external_uuid', )
+
+        external_uuid = shortuuid.uuid()
+        obj = models.ExternalUUIDModel.objects.create(external_uuid=external_uuid)
+        other = models.ExternalUUIDModel.objects.create(field=uuid.uuid4())
+        model_admin = ModelAdmin(models.ExternalUUIDModel, admin.site)
+        self.assertEqual(model_admin.get_search_uuid_fields(self.request), ('field', 'external_uuid', ))
+        queryset = models.ExternalUUIDModel.objects.all()
+        for short_circuit in (False, True, ):
+            model_admin.search_uuid_short_circuit = short_circuit
+            results, _ = model_admin.get_search_results(self.request, queryset, external_uuid)
+            self.assertEqual(list(results), [obj])
+            results, _ = model_admin.get_search_results(self.request, queryset, codec.encode(other.field))
+            self.assertEqual(list(results), [other])
+
+
+class User:
+    is_active = True
+    is_staff = True
+
+    def has_perm(self, perm, obj=None):
+        return True
+
+
+class TestChangeList(django.test.TestCase):
+    def get_changelist(self, search_term, model_admin_class=ShortUUIDModelAdmin):
+        request = RequestFactory().get('/', {'q': search_term})
+        request.user = User()
+        model_admin = model_admin_class(models.ShortUUIDModel, admin.AdminSite())
+        changelist = model_admin.get_changelist_instance(request)
+        self.assertIsInstance(changelist, NativeUUIDChangeList)
+        return changelist
+
+    def test_uuid_search_skips_counts(self):
+        obj = models.ShortUUIDModel.objects.create(field=uuid.uuid4())
+        models.ShortUUIDModel.objects.create(field=uuid.uuid4())
+        with self.assertNumQueries(1):
+            changelist = self.get_changelist(codec.encode(obj.field))
+        self.assertEqual(changelist.result_count, 1)
+        self.assertIsNone(changelist.full_result_count)
+        self.assertFalse(changelist.show_full_result_count)
+        self.assertEqual(changelist.paginator.count, 1)
+        self.assertEqual(list(changelist.result_list), [obj])
+        self.assertTrue(changelist.can_show_all)
+
+    def test_uuid_search_list_max_show_all(self):
+        class ModelAdmin(ShortUUIDModelAdmin):
+            list_max_show_all = 0
+
+        obj = models.ShortUUIDModel.objects.create(field=uuid.uuid4())
+        changelist = self.get_changelist(codec.encode(obj.field), ModelAdmin)
+        self.assertEqual(changelist.result_count, 1)
+        self.assertFalse(changelist.can_show_all)
+
+    def test_uuid_search_decodes_once(self):
+        obj = models.ShortUUIDModel.objects.create(field=uuid.uuid4())
+        with mock.patch('native_shortuuid.codec.decode', wraps=codec.decode) as decode:
+            changelist = self.get_changelist(codec.encode(obj.field))
+        self.assertEqual(list(changelist.result_list), [obj])
+        self.assertEqual(decode.call_count, 1)
+
+    def test_other_search_counts(self):
+        models.ShortUUIDModel.objects.create(field=uuid.uuid4())
+        with self.assertNumQueries(2):
+            changelist = self.get_changelist('1')
+        self.assertEqual(changelist.result_count, 1)
+        self.assertEqual(changelist.full_result_count, 1)
+
+    def test_custom_changelist(self):
+        class CustomChangeList(ChangeList):
+            pass
+
+        class BaseModelAdmin(admin.ModelAdmin):
+            def get_changelist(self, request, **kwargs):
+                return CustomChangeList
+
+        class ModelAdmin(ShortUUIDModelAdmin, BaseModelAdmin):
+            pass
+
+        request = RequestFactory().get('/')
+        changelist_class = ModelAdmin(models.ShortUUIDModel, admin.AdminSite()).get_changelist(request)
+        self.assertTrue(issubclass(changelist_class, CustomChangeList))
+        self.assertTrue(issubclass(changelist_class, NativeUUIDChangeListMixin))
+        self.assertIs(ModelAdmin(models.ShortUUIDModel, admin.AdminSite()).get_changelist(request), changelist_class)
@@ -0,0 +1,57 @@
+import uuid
+
+import django.test
+from django.core import exceptions
+
+import native_shortuuid
+import shortuuid
+from native_shortuuid import cache
+from .models import ShortUUID20Model
+from .models import ShortUUIDModel
+
+
+class TestConversionCache(django.test.TestCase):
+    def test_disabled_by_default(self):
+        self.assertEqual(
+            cache.cache_info(),
+            {
+                'shortuuid': {'encode': None, 'decode': None},
+                'shortuuid20': {'encode': None, 'decode': None},
+            },
+        )
+
+    @django.test.override_settings(NATIVE_SHORTUUID_CACHE_SIZE=2)
+    def test_from_db_value(self):
+        value = shortuuid.uuid()
+        ShortUUIDModel.objects.create(field=value)
+        ShortUUID20Model.objects.create(field=value[2:])
+        cache.cache_clear()
+
+        for _ in range(3):
+            self.assertEqual(ShortUUIDModel.objects.get().field, value)
+            self.assertEqual(ShortUUID20Model.objects.get().field, value[2:])
+
+        info = cache.cache_info()
+        self.assertEqual((info['shortuuid']['encode'].hits, info['shortuuid']['encode'].misses), (2, 1))
+        self.assertEqual((info['shortuuid20']['encode'].hits, info['shortuuid20']['encode'].misses), (2, 1))
+
+    @django.test.override_settings(NATIVE_SHORTUUID_CACHE_SIZE=2)
+    def test_bounded(self):
+        cache.cache_clear()
+        field = native_shortuuid.NativeShortUUIDField()
+        for _ in range(10):
+            field.from_db_value(uuid.uuid4(), None, None)
+        info = cache.cache_info()['shortuuid']['encode']
+        self.assertEqual((info.misses, info.currsize, info.maxsize), (10, 2, 2))
+
+    @django.test.override_settings(NATIVE_SHORTUUID_CACHE_SIZE=2)
+    def test_to_python(self):
+        cache.cache_clear()
+        field = native_shortuuid.NativeShortUUID20Field()
+        value = shortuuid.uuid()[2:]
+        self.assertEqual(field.to_python(value), shortuuid.decode(value))
+        self.assertEqual(field.to_python(value), shortuuid.decode(value))
+        with self.assertRaises(exceptions.ValidationError):
+            field.to_python({})
+        info = cache.cache_info()['shortuuid20']['decode']
+        self.assertEqual((info.hits, info.misses), (1, 1))
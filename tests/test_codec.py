@@ -0,0 +1,189 @@
+import pickle
+import unittest
+import uuid
+
+import django.test
+
+import native_shortuuid
+import shortuuid
+from native_shortuuid import batch
+from native_shortuuid import codec
+
+
+class TestCodec(django.test.SimpleTestCase):
+    def test_alphabet(self):
+        self.assertEqual(codec.ALPHABET, shortuuid.get_alphabet())
+
+    def test_encode_matches_shortuuid(self):
+        values = [
+            uuid.UUID(int=0),
+            uuid.UUID(int=1),
+            uuid.UUID(int=57 ** 20 - 1),
+            uuid.UUID(int=57 ** 20),
+            uuid.UUID(int=57 ** 21),
+            uuid.UUID(int=codec.MAX_INT),
+        ] + [uuid.uuid4() for _ in range(200)]
+        for value in values:
+            for pad_length in (None, 0, 1, 20, 21, 22, 25):
+                self.assertEqual(codec.encode(value, pad_length=pad_length), shortuuid.encode(value, pad_length=pad_length))
+
+    def test_decode_matches_shortuuid(self):
+        for _ in range(200):
+            value = uuid.uuid4()
+            string = shortuuid.encode(value)
+            self.assertEqual(codec.decode(string), value)
+            self.assertEqual(codec.decode(string[-20:]), shortuuid.decode(string[-20:]))
+        self.assertEqual(codec.decode('zz'), shortuuid.decode('zz'))
+
+    def test_decode_invalid(self):
+        for value in ('5QaMgroc94l9xa2GdSwDzL', '5QaMgroc9409xa2GdSwDzL', '5QaMgroc94é9xa2GdSwDzL', 'z' * 22, None, 42):
+            with self.assertRaises(ValueError):
+                codec.decode(value)
+
+    def test_encode_invalid(self):
+        with self.assertRaises(ValueError):
+            codec.encode('8jeD2ws9cvwC3jEhyZCz8E')
+        with self.assertRaises(ValueError):
+            codec.int_to_string(codec.MAX_INT + 1)
+
+    def test_uuid_from_int(self):
+        for number in (0, 1, codec.MAX_INT, uuid.uuid4().int):
+            value = codec.uuid_from_int(number)
+            expected = uuid.UUID(int=number)
+            self.assertEqual(value, expected)
+            self.assertEqual(hash(value), hash(expected))
+            self.assertEqual(str(value), str(expected))
+            self.assertEqual(value.bytes, expected.bytes)
+            self.assertEqual(value.is_safe, uuid.SafeUUID.unknown)
+            self.assertEqual(pickle.loads(pickle.dumps(value)), expected)
+        with self.assertRaises(TypeError):
+            codec.uuid_from_int(1).int = 2
+
+    def test_bytes(self):
+        for value in (uuid.UUID(int=0), uuid.UUID(int=codec.MAX_INT), uuid.uuid4()):
+            string = codec.bytes_to_string(value.bytes)
+            self.assertEqual(string, shortuuid.encode(value))
+            self.assertEqual(codec.bytes_to_string(value.bytes, pad_length=20), shortuuid.encode(value, pad_length=20))
+            self.assertEqual(codec.string_to_bytes(string), value.bytes)
+        with self.assertRaises(ValueError):
+            codec.bytes_to_string(b'\x00' * 15)
+        with self.assertRaises(ValueError):
+            codec.string_to_bytes('z' * 22)
+
+    def test_uuids_from_bytes(self):
+        value = uuid.uuid4()
+        values = [value.bytes, memoryview(value.bytes), value, None]
+        self.assertEqual(codec.uuids_from_bytes(values), [value, value, value, None])
+
+
+@unittest.skipIf(codec._speedups is None, 'native_shortuuid._speedups is not built')
+class TestSpeedups(django.test.SimpleTestCase):
+    def test_encode_matches_pure_python(self):
+        values = [0, 1, 57 ** 20 - 1, 57 ** 20, codec.MAX_INT] + [uuid.uuid4().int for _ in range(200)]
+        for value in values:
+            for pad_length in (0, 1, 20, 21, 22, 25):
+                self.assertEqual(
+                    codec._speedups.encode(value.to_bytes(16, 'big'), pad_length),
+                    codec._int_to_string(value, pad_length),
+                )
+
+    def test_decode_matches_pure_python(self):
+        for _ in range(200):
+            string = shortuuid.uuid()
+            self.assertEqual(codec._speedups.decode(string), codec._string_to_int(string))
+            self.assertEqual(codec._speedups.decode(string[2:]), codec._string_to_int(string[2:]))
+
+    def test_decode_invalid(self):
+        for value in ('5QaMgroc94l9xa2GdSwDzL', '5QaMgroc94é9xa2GdSwDzL', 'z' * 22, None):
+            with self.assertRaises(ValueError):
+                codec._speedups.decode(value)
+
+
+class TestBatch(django.test.SimpleTestCase):
+    def test_encode_many(self):
+        values = [uuid.uuid4() for _ in range(10)] + [None]
+        self.assertEqual(native_shortuuid.encode_many(iter(values)), [value and shortuuid.encode(value) for value in values])
+        self.assertEqual(
+            native_shortuuid.encode_many(values, pad_length=20),
+            [value and shortuuid.encode(value, pad_length=20) for value in values],
+        )
+
+    def test_encode_many_errors(self):
+        with self.assertRaises(native_shortuuid.ShortUUIDBatchError) as cm:
+            native_shortuuid.encode_many([uuid.uuid4(), 'not-a-uuid', uuid.uuid4(), 42])
+        self.assertEqual(set(cm.exception.errors), {1, 3})
+
+    def test_decode_many(self):
+        values = [uuid.uuid4() for _ in range(10)]
+        strings = [shortuuid.encode(value) for value in values] + [None]
+        self.assertEqual(native_shortuuid.decode_many(strings), values + [None])
+
+    def test_decode_many_errors(self):
+        strings = [shortuuid.uuid(), 'not-a-shortuuid', '5QaMgroc94l9xa2GdSwDzL', 'z' * 22, 42, shortuuid.uuid()[2:]]
+        with self.assertRaises(native_shortuuid.ShortUUIDBatchError) as cm:
+            native_shortuuid.decode_many(strings)
+        self.assertEqual(set(cm.exception.errors), {1, 2, 3, 4})
+
+        decoded = native_shortuuid.decode_many(strings, strict=False)
+        self.assertEqual(decoded[1:5], [None] * 4)
+        self.assertEqual(decoded[0], shortuuid.decode(strings[0]))
+        self.assertEqual(decoded[5], shortuuid.decode(strings[5]))
+
+
+@unittest.skipIf(batch.numpy is None, 'NumPy is not installed')
+class TestBatchNumpy(django.test.SimpleTestCase):
+    def test_encode_many(self):
+        values = [uuid.uuid4() for _ in range(300)] + [uuid.UUID(int=0), uuid.UUID(int=codec.MAX_INT), None]
+        for pad_length in (20, 22):
+            errors = {}
+            self.assertEqual(
+                batch._numpy_encode_many(values, pad_length, errors),
+                [value and shortuuid.encode(value, pad_length=pad_length) for value in values],
+            )
+            self.assertEqual(errors, {})
+
+    def test_decode_many(self):
+        values = [uuid.uuid4() for _ in range(300)]
+        strings = [shortuuid.encode(value) for value in values]
+        strings += [strings[0][2:], None, 'not-a-shortuuid', '5QaMgroc94l9xa2GdSwDzL', 'z' * 22, 'é' * 22]
+        errors = {}
+        decoded = batch._numpy_decode_many(strings, errors)
+        self.assertEqual(decoded[:300], values)
+        self.assertEqual(decoded[300], shortuuid.decode(strings[0][2:]))
+        self.assertEqual(decoded[301:], [None] * 5)
+        self.assertEqual(set(errors), {302, 303, 304, 305})
+
+
+class TestIsValid(django.test.SimpleTestCase):
+    def test_valid(self):
+        for _ in range(100):
+            string = shortuuid.uuid()
+            self.assertTrue(native_shortuuid.is_valid(string))
+            self.assertTrue(native_shortuuid.is_valid(string[2:]))
+            self.assertTrue(native_shortuuid.is_valid(string, length=22))
+        self.assertTrue(native_shortuuid.is_valid(codec.int_to_string(codec.MAX_INT)))
+        self.assertTrue(native_shortuuid.is_valid('z' * 20))
+        self.assertTrue(native_shortuuid.is_valid('2' * 3 + codec.int_to_string(codec.MAX_INT), length=25))
+
+    def test_invalid(self):
+        for value in (
+            None, 42, uuid.uuid4(), '', '2' * 19, '2' * 21, '2' * 23,
+            '5QaMgroc94l9xa2GdSwDzL', '5QaMgroc9409xa2GdSwDzL', '5QaMgroc94é9xa2GdSwDzL',
+            codec.int_to_string(codec.MAX_INT)[:-1] + 'z', 'z' * 22,
+        ):
+            self.assertFalse(native_shortuuid.is_valid(value), value)
+        self.assertFalse(native_shortuuid.is_valid(shortuuid.uuid(), length=20))
+        self.assertFalse(native_shortuuid.is_valid('3' + codec.int_to_string(codec.MAX_INT), length=23))
+
+    def test_matches_decode(self):
+        # Around the 128 bits limit, where only the leading digits tell.
+        limit = codec.int_to_string(codec.MAX_INT)
+        for index in range(22):
+            for char in codec.ALPHABET[::7]:
+                string = limit[:index] + char + limit[index + 1:]
+                try:
+                    codec.decode(string)
+                    decodable = True
+                except ValueError:
+                    decodable = False
+                self.assertEqual(native_shortuuid.is_valid(string), decodable, string)
@@ -0,0 +1,110 @@
+import uuid
+from io import StringIO
+from unittest import mock
+
+import django.test
+from django.core.management import CommandError
+from django.core.management import call_command
+from django.db import connection
+
+from native_shortuuid import codec
+from native_shortuuid.fields import convert_uuid_to_uuid_v2
+from native_shortuuid.fields import convert_uuids_to_uuid_v2
+from native_shortuuid.fields import uuid4_12bits_masked
+from tests import models
+
+
+def legacy_uuid4():
+    while True:
+        value = uuid.uuid4()
+        if value.int > codec.MAX_INT20:
+            return value
+
+
+class TestConvertUUIDsToUUIDV2(django.test.TestCase):
+    def call(self, *args, **kwargs):
+        stdout = StringIO()
+        call_command('convert_uuids_to_uuid_v2', *args, stdout=stdout, **kwargs)
+        return stdout.getvalue()
+
+    def test_convert_uuids_to_uuid_v2(self):
+        values = [legacy_uuid4() for _ in range(5)] + [uuid4_12bits_masked()]
+        self.assertEqual(convert_uuids_to_uuid_v2(values), [convert_uuid_to_uuid_v2(value) for value in values])
+
+    def test_convert(self):
+        legacy = [models.PrimaryKeyShortUUID20Model.objects.create(id=legacy_uuid4()) for _ in range(5)]
+        current = models.PrimaryKeyShortUUID20Model.objects.create()
+        related = [models.RelatedToShortUUID20Model.objects.create(shortuuid_fk=parent) for parent in legacy + [current]]
+
+        output = self.call('tests.PrimaryKeyShortUUID20Model', batch_size=2)
+        self.assertIn('Converted 5 rows of tests.PrimaryKeyShortUUID20Model', output)
+        self.assertIn('rows/s', output)
+
+        expected = {convert_uuid_to_uuid_v2(obj.id) for obj in legacy} | {codec.decode(current.id)}
+        self.assertEqual({codec.decode(obj.id) for obj in models.PrimaryKeyShortUUID20Model.objects.all()}, expected)
+        for obj in related:
+            obj.refresh_from_db()
+            self.assertEqual(codec.decode(obj.shortuuid_fk_id), convert_uuid_to_uuid_v2(codec.decode(obj.shortuuid_fk_id)))
+            self.assertIn(codec.decode(obj.shortuuid_fk_id), expected)
+
+        # Nothing is left to convert, e.g. when resuming a finished conversion
+        self.assertIn('Converted 0 rows', self.call('tests.PrimaryKeyShortUUID20Model'))
+
+    def test_default_batch_size(self):
+        legacy = [models.PrimaryKeyShortUUID20Model(id=legacy_uuid4()) for _ in range(1000)]
+        models.PrimaryKeyShortUUID20Model.objects.bulk_create(legacy)
+        models.RelatedToShortUUID20Model.objects.bulk_create(
+            [models.RelatedToShortUUID20Model(shortuuid_fk_id=obj.id) for obj in legacy])
+        params_counts = []
+
+        def count_params(execute, sql, params, many, context):
+            params_counts.append(len(params or ()))
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_params):
+            self.assertIn('Converted 1000 rows', self.call('tests.PrimaryKeyShortUUID20Model'))
+        if connection.features.max_query_params:
+            self.assertLessEqual(max(params_counts), connection.features.max_query_params)
+        expected = {convert_uuid_to_uuid_v2(obj.id) for obj in legacy}
+        self.assertEqual({codec.decode(value) for value in models.RelatedToShortUUID20Model.objects.values_list(
+            'shortuuid_fk_id', flat=True)}, expected)
+
+    def test_no_decoding(self):
+        legacy = [models.PrimaryKeyShortUUID20Model.objects.create(id=legacy_uuid4()) for _ in range(50)]
+        with mock.patch('native_shortuuid.codec.string_to_int', side_effect=AssertionError('decoded')):
+            self.assertIn('Converted 50 rows', self.call('tests.PrimaryKeyShortUUID20Model'))
+        expected = {convert_uuid_to_uuid_v2(obj.id) for obj in legacy}
+        self.assertEqual({codec.decode(obj.id) for obj in models.PrimaryKeyShortUUID20Model.objects.all()}, expected)
+
+    def test_convert_binary(self):
+        value = legacy_uuid4()
+        obj = models.BinaryShortUUIDModel.objects.create(field20=value)
+        self.assertIn('Converted 1 rows', self.call('tests.BinaryShortUUIDModel', field='field20'))
+        obj.refresh_from_db()
+        self.assertEqual(codec.decode(obj.field20), convert_uuid_to_uuid_v2(value))
+
+    def test_convert_inherited(self):
+        grandchild = models.ShortUUID20Grandchild.objects.create(id=legacy_uuid4())
+        related = models.RelatedToShortUUID20Model.objects.create(shortuuid_fk=grandchild)
+        new_value = convert_uuid_to_uuid_v2(grandchild.id)
+
+        self.call('tests.PrimaryKeyShortUUID20Model')
+        self.assertEqual(codec.decode(models.ShortUUID20Grandchild.objects.get().id), new_value)
+        self.assertEqual(codec.decode(models.ShortUUID20Child.objects.get().id), new_value)
+        related.refresh_from_db()
+        self.assertEqual(codec.decode(related.shortuuid_fk_id), new_value)
+
+    def test_dry_run(self):
+        value = legacy_uuid4()
+        models.PrimaryKeyShortUUID20Model.objects.create(id=value)
+        output = self.call('tests.PrimaryKeyShortUUID20Model', dry_run=True)
+        self.assertIn('1 rows to convert', output)
+        self.assertEqual(codec.decode(models.PrimaryKeyShortUUID20Model.objects.get().id), value)
+
+    def test_invalid(self):
+        with self.assertRaises(CommandError):
+            self.call('tests.Unknown')
+        with self.assertRaises(CommandError):
+            self.call('tests.PrimaryKeyShortUUIDModel')
+        with self.assertRaises(CommandError):
+            self.call('tests.PrimaryKeyShortUUID20Model', batch_size=0)
@@ -0,0 +1,58 @@
+import csv
+import io
+import json
+import uuid
+
+import django.test
+
+from native_shortuuid import codec
+from native_shortuuid import export
+from native_shortuuid.fields import short_uuid4_20
+from tests import models
+
+
+class TestExport(django.test.TestCase):
+    def test_iter_rows(self):
+        objects = [models.ShortUUIDModel.objects.create(field=uuid.uuid4()) for _ in range(5)]
+        rows = list(export.iter_rows(models.ShortUUIDModel.objects.order_by('pk'), ['pk', 'field'], chunk_size=2))
+        self.assertEqual(rows, [(obj.pk, codec.encode(obj.field)) for obj in objects])
+
+    def test_iter_rows_20(self):
+        legacy = uuid.UUID(int=codec.MAX_INT)
+        objects = [
+            models.NullableShortUUID20Model.objects.create(field=short_uuid4_20()),
+            models.NullableShortUUID20Model.objects.create(field=legacy),
+            models.NullableShortUUID20Model.objects.create(field=None),
+        ]
+        rows = list(export.iter_rows(models.NullableShortUUID20Model.objects.order_by('pk'), ['field']))
+        self.assertEqual(rows, [(objects[0].field, ), (codec.encode(legacy), ), (None, )])
+        self.assertEqual(len(rows[0][0]), 20)
+
+    def test_iter_rows_related(self):
+        parent = models.PrimaryKeyShortUUID20Model.objects.create()
+        models.RelatedToShortUUID20Model.objects.create(shortuuid_fk=parent)
+        rows = list(export.iter_rows(models.RelatedToShortUUID20Model.objects.all(), ['shortuuid_fk', 'shortuuid_fk__id']))
+        self.assertEqual(rows, [(parent.pk, parent.pk)])
+
+    def test_iter_rows_binary(self):
+        obj = models.BinaryShortUUIDModel.objects.create(field20=short_uuid4_20())
+        related = models.RelatedToBinaryShortUUIDModel.objects.create(binary_fk=obj)
+        models.BinaryShortUUIDModel.objects.create(field20=None)
+        rows = list(export.iter_rows(models.BinaryShortUUIDModel.objects.all(), ['id', 'field20']))
+        self.assertIn((obj.id, obj.field20), rows)
+        self.assertIn(None, [field20 for _, field20 in rows])
+
+        fields = ['pk', 'binary_fk', 'binary_fk__field20']
+        rows = list(export.iter_rows(models.RelatedToBinaryShortUUIDModel.objects.all(), fields))
+        self.assertEqual(rows, [(related.pk, obj.id, obj.field20)])
+
+    def test_iter_csv(self):
+        obj = models.ShortUUIDModel.objects.create(field=uuid.uuid4())
+        lines = list(export.iter_csv(models.ShortUUIDModel.objects.all(), ['pk', 'field']))
+        rows = list(csv.reader(io.StringIO(''.join(lines))))
+        self.assertEqual(rows, [['pk', 'field'], [str(obj.pk), codec.encode(obj.field)]])
+
+    def test_iter_jsonl(self):
+        obj = models.ShortUUIDModel.objects.create(field=uuid.uuid4())
+        lines = list(export.iter_jsonl(models.ShortUUIDModel.objects.all(), ['pk', 'field']))
+        self.assertEqual([json.loads(line) for line in lines], [{'pk': obj.pk, 'field': codec.encode(obj.field)}])
@@ -0,0 +1,106 @@
+from unittest import mock
+
+import django.test
+from django.core import exceptions
+
+import native_shortuuid
+import rest_framework.exceptions
+import shortuuid
+from native_shortuuid.fields import LeanShortUUID20SerializerField
+from native_shortuuid.fields import LeanShortUUIDSerializerField
+from native_shortuuid.fields import NativeShortUUID20SerializerField
+from native_shortuuid.fields import NativeShortUUIDSerializerField
+from native_shortuuid.values import ShortUUIDString
+from .models import ShortUUID20Model
+from .models import ShortUUIDModel
+
+
+class TestFormFields(django.test.SimpleTestCase):
+    def test_clean(self):
+        value = shortuuid.uuid()
+        cleaned = native_shortuuid.NativeShortUUIDFormField().clean(value)
+        self.assertIsInstance(cleaned, ShortUUIDString)
+        self.assertEqual(cleaned, value)
+        self.assertEqual(cleaned.uuid, shortuuid.decode(value))
+
+    def test_clean_20(self):
+        value = shortuuid.uuid()
+        for data in (value, value[2:]):
+            cleaned = native_shortuuid.NativeShortUUID20FormField().clean(data)
+            self.assertEqual(cleaned, value[2:])
+            self.assertEqual(cleaned.uuid, shortuuid.decode(value[2:]))
+
+    def test_invalid(self):
+        for form_field_class in (native_shortuuid.NativeShortUUIDFormField, native_shortuuid.NativeShortUUID20FormField):
+            for value in ('not-a-shortuuid', '5QaMgroc94l9xa2GdSwDzL', 'z' * 22):
+                with self.assertRaises(exceptions.ValidationError):
+                    form_field_class().clean(value)
+            self.assertIsNone(form_field_class(required=False).clean(''))
+
+
+class TestSerializerFields(django.test.SimpleTestCase):
+    def test_to_internal_value(self):
+        value = shortuuid.uuid()
+        internal = NativeShortUUIDSerializerField().run_validation(value)
+        self.assertEqual(internal, value)
+        self.assertEqual(internal.uuid, shortuuid.decode(value))
+
+        for data in (value, value[2:]):
+            internal = NativeShortUUID20SerializerField().run_validation(data)
+            self.assertEqual(internal, value[2:])
+            self.assertEqual(internal.uuid, shortuuid.decode(value[2:]))
+
+    def test_invalid(self):
+        for serializer_field_class in (NativeShortUUIDSerializerField, NativeShortUUID20SerializerField):
+            for value in ('not-a-shortuuid', '5QaMgroc94l9xa2GdSwDzL', 'z' * 22, 42):
+                with self.assertRaises(rest_framework.exceptions.ValidationError):
+                    serializer_field_class().run_validation(value)
+
+
+class TestLeanSerializerFields(django.test.SimpleTestCase):
+    def test_matches_serializer_fields(self):
+        values = [shortuuid.uuid() for _ in range(50)] + ['z' * 20, shortuuid.uuid()[2:]]
+        for field_class, lean_field_class in (
+            (NativeShortUUIDSerializerField, LeanShortUUIDSerializerField),
+            (NativeShortUUID20SerializerField, LeanShortUUID20SerializerField),
+        ):
+            for value in values:
+                expected = field_class().run_validation(value)
+                internal = lean_field_class().run_validation(value)
+                self.assertIsInstance(internal, ShortUUIDString)
+                self.assertEqual(internal, expected)
+                self.assertEqual(internal.uuid, expected.uuid)
+                self.assertEqual(lean_field_class(return_uuid=True).run_validation(value), expected.uuid)
+
+    def test_invalid(self):
+        for field_class in (LeanShortUUIDSerializerField, LeanShortUUID20SerializerField):
+            invalid = ('', 'not-a-shortuuid', '5QaMgroc94l9xa2GdSwDzL', 'z' * 22, '2' * 21, '\x00' * 22, 'é' * 22, 42, None)
+            for value in invalid:
+                with self.assertRaises(rest_framework.exceptions.ValidationError, msg=value):
+                    field_class().run_validation(value)
+            self.assertIsNone(field_class(allow_null=True).run_validation(None))
+
+    def test_trim_whitespace(self):
+        value = shortuuid.uuid()
+        self.assertEqual(LeanShortUUIDSerializerField().run_validation(f' {value}\n'), value)
+        self.assertEqual(LeanShortUUID20SerializerField().run_validation(f' {value}\n'), value[2:])
+
+    def test_to_representation(self):
+        value = shortuuid.uuid()
+        self.assertEqual(LeanShortUUIDSerializerField().to_representation(shortuuid.decode(value)), value)
+        self.assertEqual(LeanShortUUID20SerializerField().to_representation(value), value[2:])
+
+
+class TestModelReusesDecodedUUID(django.test.TestCase):
+    def test_save(self):
+        value = shortuuid.uuid()
+        for model, field_class in (
+            (ShortUUIDModel, NativeShortUUIDSerializerField),
+            (ShortUUID20Model, NativeShortUUID20SerializerField),
+        ):
+            internal = field_class().run_validation(value)
+            with mock.patch('native_shortuuid.codec.string_to_int', side_effect=AssertionError('decoded')):
+                instance = model.objects.create(field=internal)
+                self.assertTrue(model.objects.filter(field=internal).exists())
+            instance.refresh_from_db()
+            self.assertEqual(instance.field, internal)
@@ -0,0 +1,52 @@
+from io import StringIO
+
+import django.db
+import django.test
+from django.core.management import call_command
+from django.db.models import F
+
+import native_shortuuid
+import shortuuid
+from native_shortuuid.functions import ShortUUIDDecode
+from native_shortuuid.functions import ShortUUIDEncode
+from .models import NullableShortUUID20Model
+from .models import NullableShortUUIDModel
+
+
+class TestShortUUIDFunctions(django.test.TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.values = [shortuuid.uuid() for _ in range(5)]
+        cls.values20 = [shortuuid.encode(native_shortuuid.uuid4_12bits_masked(), pad_length=20) for _ in range(5)]
+        NullableShortUUIDModel.objects.bulk_create([NullableShortUUIDModel(field=value) for value in cls.values + [None]])
+        NullableShortUUID20Model.objects.bulk_create(
+            [NullableShortUUID20Model(field=value) for value in cls.values20 + cls.values[:1] + [None]])
+
+    def test_encode(self):
+        self.assertEqual(
+            list(NullableShortUUIDModel.objects.order_by('pk').values_list(ShortUUIDEncode('field'), flat=True)),
+            self.values + [None],
+        )
+        queryset = NullableShortUUID20Model.objects.order_by('pk')
+        self.assertEqual(
+            list(queryset.values_list(ShortUUIDEncode(F('field'), length=20), flat=True)),
+            self.values20 + self.values[:1] + [None],
+        )
+
+    def test_encode_invalid_length(self):
+        with self.assertRaises(ValueError):
+            ShortUUIDEncode('field', length=21)
+
+    def test_decode(self):
+        queryset = NullableShortUUIDModel.objects.annotate(encoded=ShortUUIDEncode('field')).filter(
+            field=ShortUUIDDecode('encoded'))
+        self.assertEqual(queryset.count(), 5)
+        self.assertEqual(
+            NullableShortUUIDModel.objects.filter(field=ShortUUIDDecode(django.db.models.Value(self.values[2]))).get().field,
+            self.values[2],
+        )
+
+    def test_install_command(self):
+        out = StringIO()
+        call_command('install_shortuuid_functions', stdout=out)
+        self.assertIn('Nothing to install', out.getvalue())
@@ -0,0 +1,116 @@
+import os
+import threading
+import time
+import unittest
+import uuid
+
+import django.test
+
+import native_shortuuid
+from native_shortuuid import codec
+from native_shortuuid import generators
+from native_shortuuid.fields import short_uuid4
+from native_shortuuid.fields import short_uuid4_20
+from native_shortuuid.fields import short_uuid7
+from native_shortuuid.fields import short_uuid7_20
+from native_shortuuid.fields import uuid4_12bits_masked
+from native_shortuuid.values import ShortUUIDString
+from tests import models
+
+
+class TestGenerators(django.test.SimpleTestCase):
+    def test_uuid4_int(self):
+        values = {generators.uuid4_int() for _ in range(1000)}
+        self.assertEqual(len(values), 1000)
+        for value in values:
+            self.assertEqual(uuid.UUID(int=value).version, 4)
+            self.assertEqual(uuid.UUID(int=value).variant, uuid.RFC_4122)
+
+    def test_uuid4_ints(self):
+        for count in (0, 1, 300, 1000):
+            values = generators.uuid4_ints(count)
+            self.assertEqual(len(set(values)), count)
+            self.assertTrue(all(uuid.UUID(int=value).version == 4 for value in values))
+
+    def test_field_defaults(self):
+        value = uuid4_12bits_masked()
+        self.assertIsInstance(value, uuid.UUID)
+        self.assertLess(value.int, 1 << 116)
+        self.assertEqual(value.version, 4)
+
+        string = short_uuid4_20()
+        self.assertEqual(len(string), 20)
+        self.assertEqual(codec.decode(string), string.uuid)
+        string = short_uuid4()
+        self.assertEqual(len(string), 22)
+        self.assertEqual(codec.decode(string), string.uuid)
+
+    def test_uuid7(self):
+        before = time.time_ns() // 1000000
+        value = native_shortuuid.uuid7()
+        after = time.time_ns() // 1000000
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+        self.assertTrue(before <= value.int >> 80 <= after)
+
+    def test_uuid7_116bits(self):
+        before = time.time_ns() // 1000000
+        value = native_shortuuid.uuid7_116bits()
+        after = time.time_ns() // 1000000
+        self.assertLess(value.int, 1 << 116)
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+        self.assertTrue(before <= (value.int >> 80 << 12) | (value.int >> 64 & 0xfff) <= after)
+
+    def test_uuid7_ordered(self):
+        for generate, length in ((short_uuid7, 22), (short_uuid7_20, 20)):
+            strings = []
+            for _ in range(3):
+                strings.append(generate())
+                time.sleep(0.002)
+            self.assertEqual(sorted(strings), strings)
+            self.assertEqual([string.uuid for string in strings], sorted(string.uuid for string in strings))
+            self.assertEqual({len(string) for string in strings}, {length})
+
+    def test_generate_many(self):
+        for length in (20, 22):
+            strings = native_shortuuid.generate_many(500, length=length)
+            self.assertEqual(len(set(strings)), 500)
+            for string in strings:
+                self.assertIsInstance(string, ShortUUIDString)
+                self.assertEqual(len(string), length)
+                self.assertEqual(codec.decode(string), string.uuid)
+        with self.assertRaises(ValueError):
+            native_shortuuid.generate_many(1, length=21)
+
+    def test_threads(self):
+        results = []
+        threads = [threading.Thread(target=lambda: results.extend(generators.uuid4_ints(100))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(results)), 400)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'os.fork is not available')
+    def test_fork(self):
+        generators.uuid4_int()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, generators.uuid4_int().to_bytes(16, 'big'))
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd, 'rb') as pipe:
+            child_value = int.from_bytes(pipe.read(), 'big')
+        os.waitpid(pid, 0)
+        self.assertNotEqual(child_value, generators.uuid4_int())
+
+
+class TestOrderedDefaults(django.test.TestCase):
+    def test_save(self):
+        for model, length in ((models.OrderedShortUUIDModel, 22), (models.OrderedShortUUID20Model, 20)):
+            obj = model.objects.create()
+            self.assertEqual(len(obj.pk), length)
+            self.assertEqual(model.objects.get().pk, obj.pk)
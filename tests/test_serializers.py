@@ -0,0 +1,139 @@
+import uuid
+
+import django.test
+
+import rest_framework.serializers
+from native_shortuuid import codec
+from native_shortuuid.fields import NativeShortUUID20SerializerField
+from native_shortuuid.fields import NativeShortUUIDSerializerField
+from native_shortuuid.fields import uuid4_12bits_masked
+from native_shortuuid.serializers import ShortUUIDListSerializer
+from native_shortuuid.serializers import ShortUUIDModelSerializerMixin
+from native_shortuuid.values import LazyShortUUID
+from native_shortuuid.values import LazyShortUUID20
+from native_shortuuid.values import ShortUUIDString
+from tests import models
+
+
+class Serializer(rest_framework.serializers.Serializer):
+    field = NativeShortUUIDSerializerField()
+    field20 = NativeShortUUID20SerializerField()
+    name = rest_framework.serializers.CharField(required=False)
+
+    class Meta:
+        list_serializer_class = ShortUUIDListSerializer
+
+
+class Object:
+    def __init__(self, field, field20, **kwargs):
+        self.field = field
+        self.field20 = field20
+        self.__dict__.update(kwargs)
+
+
+class TestShortUUIDListSerializer(django.test.SimpleTestCase):
+    def test_to_representation(self):
+        value = uuid.uuid4()
+        value20 = uuid4_12bits_masked()
+        legacy = uuid.UUID(int=codec.MAX_INT)
+        objects = [
+            Object(value, value20, name='a'),
+            Object(ShortUUIDString.from_uuid(value), ShortUUIDString.from_uuid20(value20)),
+            Object(LazyShortUUID(value), LazyShortUUID20(value20)),
+            Object(codec.encode(value), codec.encode(value20)),
+            Object(None, None),
+            Object(legacy, legacy),
+            Object(LazyShortUUID(legacy), LazyShortUUID20(legacy)),
+        ]
+        data = Serializer(objects, many=True).data
+        self.assertIsInstance(Serializer(many=True), ShortUUIDListSerializer)
+        self.assertEqual(data, [Serializer(obj).data for obj in objects])
+        self.assertEqual(data[0], {'field': codec.encode(value), 'field20': codec.encode20(value20), 'name': 'a'})
+        self.assertEqual(data[4], {'field': None, 'field20': None})
+        self.assertEqual(data[6]['field20'], codec.encode(legacy)[2:])
+
+    def test_reuses_strings(self):
+        string = ShortUUIDString.from_uuid(uuid.uuid4())
+        data = Serializer([Object(string, None)], many=True).data
+        self.assertIs(data[0]['field'], string)
+
+    def test_child_to_representation(self):
+        class CustomSerializer(Serializer):
+            def to_representation(self, instance):
+                return {'custom': super().to_representation(instance)['field']}
+
+        value = uuid.uuid4()
+        self.assertEqual(CustomSerializer([Object(value, None)], many=True).data, [{'custom': codec.encode(value)}])
+
+    def test_field_to_representation(self):
+        class PrefixedField(NativeShortUUIDSerializerField):
+            def to_representation(self, value):
+                return 'obj_' + super().to_representation(value)
+
+        class PrefixedSerializer(Serializer):
+            field = PrefixedField()
+
+        value = uuid.uuid4()
+        objects = [Object(value, None)]
+        data = PrefixedSerializer(objects, many=True).data
+        self.assertEqual(data[0]['field'], 'obj_' + codec.encode(value))
+        self.assertEqual(data, [PrefixedSerializer(obj).data for obj in objects])
+
+
+class TestToRepresentationMany(django.test.SimpleTestCase):
+    def test_same_as_to_representation(self):
+        uuids = [uuid.uuid4(), uuid4_12bits_masked(), uuid.UUID(int=57 ** 21 - 1), uuid.UUID(int=codec.MAX_INT)]
+        values = [None]
+        for value in uuids:
+            values += [
+                value, LazyShortUUID(value), LazyShortUUID20(value),
+                ShortUUIDString.from_uuid(value), ShortUUIDString.from_uuid20(value),
+            ]
+        for field in (NativeShortUUIDSerializerField(), NativeShortUUID20SerializerField()):
+            expected = [None] + [field.to_representation(value) for value in values[1:]]
+            self.assertEqual(field.to_representation_many(values), expected, field)
+
+
+class RelatedToShortUUIDModelSerializer(ShortUUIDModelSerializerMixin, rest_framework.serializers.ModelSerializer):
+    class Meta:
+        model = models.RelatedToShortUUIDModel
+        fields = ('id', 'shortuuid_fk', )
+
+
+class ShortUUID20ModelSerializer(ShortUUIDModelSerializerMixin, rest_framework.serializers.ModelSerializer):
+    class Meta:
+        model = models.LazyShortUUID20Model
+        fields = ('id', 'field', )
+
+
+class TestShortUUIDModelSerializerMixin(django.test.TestCase):
+    def test_fields(self):
+        fields = RelatedToShortUUIDModelSerializer().fields
+        self.assertIsInstance(fields['shortuuid_fk'].pk_field, NativeShortUUIDSerializerField)
+        self.assertIsInstance(ShortUUID20ModelSerializer().fields['field'], NativeShortUUID20SerializerField)
+        self.assertIsInstance(RelatedToShortUUIDModelSerializer(many=True), ShortUUIDListSerializer)
+
+    def test_own_list_serializer_class(self):
+        class OwnListSerializer(ShortUUIDModelSerializerMixin, rest_framework.serializers.ModelSerializer):
+            class Meta:
+                model = models.LazyShortUUID20Model
+                fields = ('id', 'field', )
+                list_serializer_class = rest_framework.serializers.ListSerializer
+
+        self.assertIs(type(OwnListSerializer(many=True)), rest_framework.serializers.ListSerializer)
+
+    def test_to_representation(self):
+        parents = [models.PrimaryKeyShortUUIDModel.objects.create() for _ in range(3)]
+        objects = [models.RelatedToShortUUIDModel.objects.create(shortuuid_fk=parent) for parent in parents]
+        data = RelatedToShortUUIDModelSerializer(models.RelatedToShortUUIDModel.objects.order_by('id'), many=True).data
+        self.assertEqual(data, [{'id': obj.id, 'shortuuid_fk': obj.shortuuid_fk_id} for obj in objects])
+
+        objects = [models.LazyShortUUID20Model.objects.create(field=uuid4_12bits_masked()) for _ in range(3)]
+        data = ShortUUID20ModelSerializer(models.LazyShortUUID20Model.objects.order_by('id'), many=True).data
+        self.assertEqual(data, [{'id': obj.id, 'field': codec.encode20(obj.field)} for obj in objects])
+
+    def test_to_internal_value(self):
+        parent = models.PrimaryKeyShortUUIDModel.objects.create()
+        serializer = RelatedToShortUUIDModelSerializer(data={'shortuuid_fk': parent.pk})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.save().shortuuid_fk, parent)
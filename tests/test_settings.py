@@ -1,6 +1,7 @@
 SECRET_KEY = 'fake-key'
 
 INSTALLED_APPS = [
+    'native_shortuuid',
     'tests',
 ]
 
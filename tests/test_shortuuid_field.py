@@ -97,6 +97,28 @@ class TestMethods(django.test.SimpleTestCase):
         self.assertEqual(set(kwargs.keys()), {'default'})
         self.assertEqual(kwargs['default'], uuid.uuid4)
 
+        field = native_shortuuid.NativeShortUUIDField(default=native_shortuuid.uuid7)
+        self.assertIs(field.default, native_shortuuid.fields.short_uuid7)
+        name, path, args, kwargs = field.deconstruct()
+        self.assertEqual(kwargs, {'default': native_shortuuid.uuid7})
+
+    def test_unhashable_default(self):
+        class Default:
+            __hash__ = None
+
+            def __eq__(self, other):
+                return isinstance(other, Default)
+
+            def __call__(self):
+                return uuid.uuid4()
+
+        default = Default()
+        for field_class in (native_shortuuid.NativeShortUUIDField, native_shortuuid.NativeShortUUID20Field):
+            field = field_class(default=default)
+            self.assertIs(field.default, default)
+            name, path, args, kwargs = field.deconstruct()
+            self.assertIs(kwargs['default'], default)
+
     def test_to_python(self):
         self.assertIsNone(native_shortuuid.NativeShortUUIDField().to_python(None))
 
@@ -137,6 +159,31 @@ class TestQuerying(django.test.TestCase):
             [self.objs[1]],
         )
 
+    def test_in(self):
+        self.assertSequenceEqual(
+            NullableShortUUIDModel.objects.filter(field__in=[
+                'H9cNmGXLE6446655442222',
+                'H9cNmGXLE6446655442222',
+                uuid.UUID('550e8400-e29b-3a56-e212-4d8b73e7390a'),
+                shortuuid.uuid(),
+                None,
+            ]),
+            [self.objs[1]],
+        )
+        self.assertSequenceEqual(NullableShortUUIDModel.objects.filter(field__in=[None]), [])
+        self.assertSequenceEqual(
+            NullableShortUUIDModel.objects.filter(field__in=(obj.field for obj in self.objs[:1])),
+            [self.objs[0]],
+        )
+        with self.assertRaisesMessage(exceptions.ValidationError, 'is not a valid ShortUUID'):
+            list(NullableShortUUIDModel.objects.filter(field__in=['H9cNmGXLE6446655442222', 'not-a-shortuuid']))
+
+    def test_in_large_list(self):
+        values = [shortuuid.uuid() for _ in range(3000)] + ['8jeD2ws9cvwC3jEhyZCz8E']
+        queryset = NullableShortUUIDModel.objects.filter(field__in=values)
+        self.assertSequenceEqual(queryset, [self.objs[0]])
+        self.assertLess(len(queryset.query.sql_with_params()[1]), 999)
+
     def test_isnull(self):
         self.assertSequenceEqual(
             NullableShortUUIDModel.objects.filter(field__isnull=True),
@@ -176,6 +223,34 @@ class TestQuerying(django.test.TestCase):
             [self.objs[1]],
         )
 
+    def test_shortuuid_startswith(self):
+        # shortuuid_startswith uses the ShortUUID through a range of UUIDs
+        for prefix, expected in (
+            ('H9cN', [self.objs[1]]),
+            ('8', [self.objs[0]]),
+            ('', self.objs[:2]),
+            ('H9cNmGXLE6446655442222', [self.objs[1]]),
+            ('H9cNmGXLE6446655442223', []),
+            ('H9cNmGXLE64466554422222', []),
+            ('H9cl', []),
+            ('zz', []),
+        ):
+            queryset = NullableShortUUIDModel.objects.filter(field__shortuuid_startswith=prefix)
+            self.assertSequenceEqual(queryset.order_by('pk'), expected, prefix)
+        self.assertNotIn('LIKE', str(NullableShortUUIDModel.objects.filter(field__shortuuid_startswith='H9cN').query))
+
+    def test_shortuuid_startswith_random(self):
+        values = [shortuuid.uuid() for _ in range(50)]
+        NullableShortUUIDModel.objects.bulk_create([NullableShortUUIDModel(field=value) for value in values])
+        for value in values[:10]:
+            for length in (1, 2, 5, 22):
+                prefix = value[:length]
+                queryset = NullableShortUUIDModel.objects.filter(field__shortuuid_startswith=prefix)
+                self.assertEqual(
+                    sorted(queryset.values_list('field', flat=True)),
+                    sorted(v for v in values + ['8jeD2ws9cvwC3jEhyZCz8E', 'H9cNmGXLE6446655442222'] if v.startswith(prefix)),
+                )
+
     def test_istartswith(self):
         # istartswith uses the UUID rather tan the ShortUUID
         self.assertSequenceEqual(
@@ -415,9 +490,30 @@ class TestMethodsShortUUID20(django.test.SimpleTestCase):
         self.assertEqual(set(kwargs.keys()), {'default'})
         self.assertEqual(kwargs['default'], native_shortuuid.fields.uuid4_12bits_masked)
 
+        field = native_shortuuid.NativeShortUUID20Field(default=native_shortuuid.uuid4_12bits_masked)
+        self.assertIs(field.default, native_shortuuid.fields.short_uuid4_20)
+        name, path, args, kwargs = field.deconstruct()
+        self.assertEqual(kwargs, {'default': native_shortuuid.uuid4_12bits_masked})
+
+        field = native_shortuuid.NativeShortUUID20Field(default=native_shortuuid.uuid7_116bits)
+        self.assertIs(field.default, native_shortuuid.fields.short_uuid7_20)
+        name, path, args, kwargs = field.deconstruct()
+        self.assertEqual(kwargs, {'default': native_shortuuid.uuid7_116bits})
+
     def test_to_python(self):
         self.assertIsNone(native_shortuuid.NativeShortUUID20Field().to_python(None))
 
+    def test_from_db_value(self):
+        field = native_shortuuid.NativeShortUUID20Field()
+        for value, expected in (
+            (uuid.UUID(int=0), '2' * 20),
+            (uuid.UUID(int=(1 << 116) - 1), shortuuid.encode(uuid.UUID(int=(1 << 116) - 1), pad_length=20)),
+            (uuid.UUID(int=57 ** 20 - 1), 'z' * 20),
+            (uuid.UUID(int=57 ** 20), '23' + '2' * 20),
+            (uuid.UUID(int=57 ** 20 - 1 + (1 << 116)), shortuuid.encode(uuid.UUID(int=57 ** 20 - 1 + (1 << 116)))),
+        ):
+            self.assertEqual(field.from_db_value(value, None, None), expected)
+
     def test_to_python_shortuuid_too_large(self):
         # Fails for strings larger than 22 characters.
         with self.assertRaises(exceptions.ValidationError):
@@ -455,6 +551,14 @@ class TestQueryingShortUUID20(django.test.TestCase):
             [self.objs[1]],
         )
 
+    def test_in(self):
+        self.assertSequenceEqual(
+            NullableShortUUID20Model.objects.filter(field__in=['cNmGXLE6446655442222', shortuuid.uuid(), None]),
+            [self.objs[1]],
+        )
+        with self.assertRaisesMessage(exceptions.ValidationError, 'is not a valid ShortUUID'):
+            list(NullableShortUUID20Model.objects.filter(field__in=['cNmGXLE6446655442222', 'not-a-shortuuid']))
+
     def test_isnull(self):
         self.assertSequenceEqual(
             NullableShortUUID20Model.objects.filter(field__isnull=True),
@@ -495,6 +599,37 @@ class TestQueryingShortUUID20(django.test.TestCase):
             [self.objs[1]],
         )
 
+    def test_shortuuid_startswith(self):
+        # shortuuid_startswith uses the ShortUUID through ranges of UUIDs
+        legacy = NullableShortUUID20Model.objects.create(field='8jeD2ws9cvwC3jEhyZCz8E')
+        for prefix, expected in (
+            ('cNm', [self.objs[1]]),
+            ('e', [self.objs[0]]),
+            ('8jeD', [legacy]),
+            ('8jeD2ws9cvwC3jEhyZCz8E', [legacy]),
+            ('', [self.objs[0], self.objs[1], legacy]),
+            ('cNmGXLE6446655442222', [self.objs[1]]),
+            ('cNmGXLE64466554422222', []),
+            ('22', []),
+            ('cNml', []),
+        ):
+            queryset = NullableShortUUID20Model.objects.filter(field__shortuuid_startswith=prefix)
+            self.assertSequenceEqual(queryset.order_by('pk'), expected, prefix)
+
+    def test_shortuuid_startswith_random(self):
+        values = [shortuuid.encode(native_shortuuid.uuid4_12bits_masked(), pad_length=20) for _ in range(30)]
+        # Rendered like the field does: the uuid4 values which fit in 20 chars are not legacy ones
+        values += [native_shortuuid.codec.encode20(uuid.uuid4()) for _ in range(30)]
+        NullableShortUUID20Model.objects.bulk_create([NullableShortUUID20Model(field=value) for value in values])
+        for value in values[:5] + values[-5:]:
+            for length in (1, 2, 5, len(value)):
+                prefix = value[:length]
+                queryset = NullableShortUUID20Model.objects.filter(field__shortuuid_startswith=prefix)
+                self.assertEqual(
+                    sorted(queryset.values_list('field', flat=True)),
+                    sorted(v for v in values + ['eD2ws9cvwC3jEhyZCz8E', 'cNmGXLE6446655442222'] if v.startswith(prefix)),
+                )
+
     def test_istartswith(self):
         # istartswith uses the UUID rather tan the ShortUUID
         self.assertSequenceEqual(
@@ -0,0 +1,202 @@
+import uuid
+from unittest import mock
+
+import django.test
+from django.db import connection
+from django.db import migrations
+from django.db import models as django_models
+from django.db.migrations.state import ProjectState
+
+import native_shortuuid
+from native_shortuuid import codec
+from native_shortuuid.functions import ShortUUIDDecode
+from native_shortuuid.functions import ShortUUIDEncode
+from native_shortuuid.operations import AlterUUIDStorage
+from tests import models
+
+
+class TestBinaryStorage(django.test.TestCase):
+    def test_column(self):
+        self.assertEqual(models.BinaryShortUUIDModel._meta.pk.db_type(connection), 'BLOB')
+        self.assertEqual(models.RelatedToBinaryShortUUIDModel._meta.get_field('binary_fk').db_type(connection), 'BLOB')
+
+    def test_save_and_load(self):
+        value20 = native_shortuuid.uuid4_12bits_masked()
+        obj = models.BinaryShortUUIDModel.objects.create(field20=value20)
+        related = models.RelatedToBinaryShortUUIDModel.objects.create(binary_fk=obj)
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT id, field20 FROM {models.BinaryShortUUIDModel._meta.db_table}')
+            self.assertEqual(cursor.fetchone(), (codec.decode(obj.pk).bytes, value20.bytes))
+
+        obj = models.BinaryShortUUIDModel.objects.get(pk=obj.pk)
+        self.assertEqual(obj.field20, codec.encode20(value20))
+        self.assertEqual(models.RelatedToBinaryShortUUIDModel.objects.get(binary_fk=obj).binary_fk_id, obj.pk)
+        self.assertEqual(models.RelatedToBinaryShortUUIDModel.objects.get(binary_fk__field20=obj.field20), related)
+
+    def test_lookups(self):
+        objects = [models.BinaryShortUUIDModel.objects.create() for _ in range(3)]
+        self.assertEqual(models.BinaryShortUUIDModel.objects.get(pk__shortuuid_startswith=objects[0].pk[:6]), objects[0])
+        queryset = models.BinaryShortUUIDModel.objects.filter(pk__in=[obj.pk for obj in objects[:2]])
+        self.assertEqual(set(queryset), set(objects[:2]))
+
+        strings = [obj.pk for obj in objects]
+        strings += [native_shortuuid.fields.short_uuid4() for _ in range(connection.features.max_query_params or 1000)]
+        self.assertEqual(models.BinaryShortUUIDModel.objects.filter(pk__in=strings).count(), 3)
+
+    def test_encode_function(self):
+        obj = models.BinaryShortUUIDModel.objects.create()
+        self.assertEqual(list(models.BinaryShortUUIDModel.objects.values_list(ShortUUIDEncode('pk'), flat=True)), [obj.pk])
+
+    def test_decode_function(self):
+        obj = models.BinaryShortUUIDModel.objects.create(field20=native_shortuuid.uuid4_12bits_masked())
+        models.BinaryShortUUIDModel.objects.create()
+        queryset = models.BinaryShortUUIDModel.objects.all()
+        self.assertSequenceEqual(queryset.filter(pk=ShortUUIDDecode(django_models.Value(str(obj.pk)))), [obj])
+        field20 = django_models.Value(codec.encode20(obj.field20))
+        self.assertSequenceEqual(queryset.filter(field20=ShortUUIDDecode(field20)), [obj])
+        queryset = queryset.annotate(encoded=ShortUUIDEncode('pk'))
+        self.assertEqual(queryset.filter(pk=ShortUUIDDecode('encoded')).count(), 2)
+
+    def test_deconstruct(self):
+        name, path, args, kwargs = models.BinaryShortUUIDModel._meta.get_field('field20').deconstruct()
+        self.assertEqual(kwargs, {'null': True, 'storage': 'binary'})
+        with self.assertRaises(ValueError):
+            native_shortuuid.NativeShortUUIDField(storage='hex')
+
+
+class TestAlterUUIDStorage(django.test.TransactionTestCase):
+    available_apps = ['tests']
+
+    def apply(self, operations, state):
+        with connection.schema_editor() as editor:
+            for operation in operations:
+                new_state = state.clone()
+                operation.state_forwards('test_storage', new_state)
+                operation.database_forwards('test_storage', editor, state, new_state)
+                state = new_state
+        return state
+
+    def test_forwards_backwards(self):
+        state = self.apply([
+            migrations.CreateModel('Parent', [('id', native_shortuuid.NativeShortUUIDField(primary_key=True))]),
+            migrations.CreateModel('Child', [
+                ('id', django_models.AutoField(primary_key=True)),
+                ('parent', django_models.ForeignKey('Parent', django_models.CASCADE, null=True)),
+            ]),
+        ], ProjectState())
+        values = [uuid.uuid4() for _ in range(3)]
+        parent_model = state.apps.get_model('test_storage', 'Parent')
+        child_model = state.apps.get_model('test_storage', 'Child')
+        for value in values:
+            child_model.objects.create(parent=parent_model.objects.create(id=value))
+        child_model.objects.create(parent=None)
+
+        operation = AlterUUIDStorage('Parent', 'id', native_shortuuid.NativeShortUUIDField(primary_key=True, storage='binary'))
+        binary_state = self.apply([operation], state)
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT id FROM test_storage_parent ORDER BY id')
+            self.assertEqual([row[0] for row in cursor.fetchall()], sorted(value.bytes for value in values))
+            cursor.execute('SELECT parent_id FROM test_storage_child WHERE parent_id IS NOT NULL ORDER BY parent_id')
+            self.assertEqual([row[0] for row in cursor.fetchall()], sorted(value.bytes for value in values))
+        child_model = binary_state.apps.get_model('test_storage', 'Child')
+        self.assertEqual(
+            sorted(child_model.objects.filter(parent__isnull=False).values_list('parent__id', flat=True)),
+            sorted(codec.encode(value) for value in values),
+        )
+
+        with connection.schema_editor() as editor:
+            operation.database_backwards('test_storage', editor, binary_state, state)
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT id FROM test_storage_parent ORDER BY id')
+            self.assertEqual([row[0] for row in cursor.fetchall()], sorted(value.hex for value in values))
+
+        with connection.schema_editor() as editor:
+            editor.delete_model(state.apps.get_model('test_storage', 'Child'))
+            editor.delete_model(state.apps.get_model('test_storage', 'Parent'))
+
+    def test_mysql_sql(self):
+        state = ProjectState()
+        for operation in (
+            migrations.CreateModel('Parent', [('id', native_shortuuid.NativeShortUUIDField(primary_key=True))]),
+            migrations.CreateModel('Child', [
+                ('parent_ptr', django_models.OneToOneField(
+                    'Parent', django_models.CASCADE, primary_key=True, parent_link=True, auto_created=True)),
+            ], bases=('test_storage.parent', )),
+            migrations.CreateModel('Related', [
+                ('id', django_models.AutoField(primary_key=True)),
+                ('parent', django_models.ForeignKey('Parent', django_models.CASCADE, null=True)),
+            ]),
+        ):
+            operation.state_forwards('test_storage', state)
+        operation = AlterUUIDStorage('Parent', 'id', native_shortuuid.NativeShortUUIDField(primary_key=True, storage='binary'))
+        binary_state = state.clone()
+        operation.state_forwards('test_storage', binary_state)
+
+        statements = []
+        editor = mock.Mock()
+        editor.connection.vendor = 'mysql'
+        editor.connection.alias = connection.alias
+        editor.connection.features.has_native_uuid_field = False
+        editor.quote_name = lambda name: f'`{name}`'
+        editor.execute = statements.append
+
+        def alter_field(*args):
+            statements.append('ALTER FIELD')
+
+        with mock.patch.object(migrations.AlterField, 'database_forwards', alter_field):
+            operation.database_forwards('test_storage', editor, state, binary_state)
+        self.assertEqual(statements, [
+            'SET FOREIGN_KEY_CHECKS = 0',
+            'ALTER TABLE `test_storage_parent` MODIFY `id` varbinary(32) NOT NULL',
+            'UPDATE `test_storage_parent` SET `id` = UNHEX(`id`)',
+            'ALTER TABLE `test_storage_child` MODIFY `parent_ptr_id` varbinary(32) NOT NULL',
+            'UPDATE `test_storage_child` SET `parent_ptr_id` = UNHEX(`parent_ptr_id`)',
+            'ALTER TABLE `test_storage_related` MODIFY `parent_id` varbinary(32)',
+            'UPDATE `test_storage_related` SET `parent_id` = UNHEX(`parent_id`)',
+            'ALTER FIELD',
+            'SET FOREIGN_KEY_CHECKS = 1',
+        ])
+
+        statements.clear()
+        with mock.patch.object(migrations.AlterField, 'database_forwards', alter_field):
+            operation.database_backwards('test_storage', editor, binary_state, state)
+        self.assertIn('UPDATE `test_storage_related` SET `parent_id` = LOWER(HEX(`parent_id`))', statements)
+        self.assertEqual(statements[-2:], ['ALTER FIELD', 'SET FOREIGN_KEY_CHECKS = 1'])
+
+    def test_inheritance(self):
+        state = self.apply([
+            migrations.CreateModel('Parent', [('id', native_shortuuid.NativeShortUUIDField(primary_key=True))]),
+            migrations.CreateModel('Child', [
+                ('parent_ptr', django_models.OneToOneField(
+                    'Parent', django_models.CASCADE, primary_key=True, parent_link=True, auto_created=True)),
+            ], bases=('test_storage.parent', )),
+            migrations.CreateModel('Grandchild', [
+                ('child_ptr', django_models.OneToOneField(
+                    'Child', django_models.CASCADE, primary_key=True, parent_link=True, auto_created=True)),
+            ], bases=('test_storage.child', )),
+            migrations.CreateModel('Related', [
+                ('id', django_models.AutoField(primary_key=True)),
+                ('grandchild', django_models.ForeignKey('Grandchild', django_models.CASCADE)),
+            ]),
+        ], ProjectState())
+        value = uuid.uuid4()
+        grandchild = state.apps.get_model('test_storage', 'Grandchild').objects.create(id=value)
+        state.apps.get_model('test_storage', 'Related').objects.create(grandchild=grandchild)
+
+        operation = AlterUUIDStorage('Parent', 'id', native_shortuuid.NativeShortUUIDField(primary_key=True, storage='binary'))
+        binary_state = self.apply([operation], state)
+        with connection.cursor() as cursor:
+            for table, column in (
+                ('test_storage_parent', 'id'),
+                ('test_storage_child', 'parent_ptr_id'),
+                ('test_storage_grandchild', 'child_ptr_id'),
+                ('test_storage_related', 'grandchild_id'),
+            ):
+                cursor.execute(f'SELECT {column} FROM {table}')
+                self.assertEqual(cursor.fetchall(), [(value.bytes, )], table)
+        related_model = binary_state.apps.get_model('test_storage', 'Related')
+        self.assertEqual(related_model.objects.get().grandchild.id, codec.encode(value))
+
+        with connection.schema_editor() as editor:
+            for model_name in ('Related', 'Grandchild', 'Child', 'Parent', ):
+                editor.delete_model(binary_state.apps.get_model('test_storage', model_name))
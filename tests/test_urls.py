@@ -0,0 +1,71 @@
+import uuid
+
+import django.test
+from django.urls import Resolver404
+from django.urls import path
+from django.urls import resolve
+from django.urls import reverse
+
+import shortuuid
+from native_shortuuid import codec
+from native_shortuuid import validation  # noqa: F401, registers the converters
+from native_shortuuid.values import ShortUUIDString
+from tests.models import ShortUUIDModel
+
+
+def view(request, value):
+    pass
+
+
+urlpatterns = [
+    path('shortuuid/<decoded_shortuuid:value>/', view, name='decoded_shortuuid'),
+    path('shortuuid20/<decoded_shortuuid20:value>/', view, name='decoded_shortuuid20'),
+]
+
+
+@django.test.override_settings(ROOT_URLCONF='tests.test_urls')
+class TestDecodedConverters(django.test.TestCase):
+    def test_resolve(self):
+        string = shortuuid.uuid()
+        value = resolve(f'/shortuuid/{string}/').kwargs['value']
+        self.assertIsInstance(value, ShortUUIDString)
+        self.assertEqual(value, string)
+        self.assertEqual(value.uuid, shortuuid.decode(string))
+
+        value = resolve(f'/shortuuid/{string[2:]}/').kwargs['value']
+        self.assertEqual(value.uuid, shortuuid.decode(string[2:]))
+
+    def test_resolve_20(self):
+        string = shortuuid.uuid()
+        for path_string in (string, string[2:]):
+            value = resolve(f'/shortuuid20/{path_string}/').kwargs['value']
+            self.assertIsInstance(value, ShortUUIDString)
+            self.assertEqual(value, string[2:])
+            self.assertEqual(value.uuid, shortuuid.decode(string[2:]))
+
+    def test_resolve_invalid(self):
+        for string in (
+            '5QaMgroc94l9xa2GdSwDzL', '5QaMgroc9409xa2GdSwDzL', 'z' * 22, 'p' + '2' * 21,
+            codec.int_to_string(codec.MAX_INT)[:-1] + 'z', '2' * 21, '2' * 23,
+        ):
+            for prefix in ('shortuuid', 'shortuuid20'):
+                with self.assertRaises(Resolver404, msg=string):
+                    resolve(f'/{prefix}/{string}/')
+
+    def test_reverse(self):
+        value = uuid.UUID(int=uuid.uuid4().int % 57 ** 21)
+        string = shortuuid.encode(value)
+        self.assertEqual(reverse('decoded_shortuuid', args=[value]), f'/shortuuid/{string}/')
+        self.assertEqual(reverse('decoded_shortuuid', args=[string]), f'/shortuuid/{string}/')
+        self.assertEqual(reverse('decoded_shortuuid20', args=[value]), f'/shortuuid20/{string[2:]}/')
+        self.assertEqual(reverse('decoded_shortuuid20', args=[string]), f'/shortuuid20/{string[2:]}/')
+
+    def test_reverse_21_digits(self):
+        value = uuid.UUID(int=57 ** 21 - 1)
+        self.assertEqual(reverse('decoded_shortuuid20', args=[value]), f'/shortuuid20/{"z" * 20}/')
+        self.assertEqual(resolve(f'/shortuuid20/{"z" * 20}/').kwargs['value'].uuid.int, value.int % 57 ** 20)
+
+    def test_lookup(self):
+        obj = ShortUUIDModel.objects.create(field=uuid.uuid4())
+        value = resolve(f'/shortuuid/{codec.encode(obj.field)}/').kwargs['value']
+        self.assertEqual(ShortUUIDModel.objects.get(field=value), obj)
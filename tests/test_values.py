@@ -0,0 +1,153 @@
+import json
+import pickle
+import uuid
+from unittest import mock
+
+import django.test
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.functional import Promise
+
+import native_shortuuid
+import rest_framework.utils.encoders
+import shortuuid
+from native_shortuuid.values import LazyShortUUID
+from native_shortuuid.values import LazyShortUUID20
+from native_shortuuid.values import ShortUUIDString
+from .models import LazyShortUUID20Model
+from .models import LazyShortUUIDModel
+from .models import PrimaryKeyShortUUID20Model
+from .models import PrimaryKeyShortUUIDModel
+from .models import RelatedToShortUUID20Model
+from .models import RelatedToShortUUIDModel
+
+
+class TestLazyShortUUID(django.test.SimpleTestCase):
+    def test_encoded_on_first_use(self):
+        value = uuid.uuid4()
+        lazy = LazyShortUUID(value)
+        self.assertIsNone(lazy._string)
+        self.assertEqual(str(lazy), shortuuid.encode(value))
+        self.assertEqual(lazy._string, shortuuid.encode(value))
+
+    def test_behaves_like_str(self):
+        value = uuid.uuid4()
+        string = shortuuid.encode(value)
+        lazy = LazyShortUUID(value)
+        self.assertEqual(lazy, string)
+        self.assertEqual(string, lazy)
+        self.assertEqual(lazy, LazyShortUUID(value))
+        self.assertNotEqual(lazy, shortuuid.uuid())
+        self.assertEqual(hash(lazy), hash(string))
+        self.assertEqual(len(lazy), 22)
+        self.assertEqual(lazy[2:], string[2:])
+        self.assertIn(string[:5], lazy)
+        self.assertEqual(f'{lazy}', string)
+        self.assertEqual(pickle.loads(pickle.dumps(lazy)), lazy)
+
+    def test_eq_hash(self):
+        value = native_shortuuid.uuid4_12bits_masked()
+        lazy = LazyShortUUID(value)
+        lazy20 = LazyShortUUID20(value)
+        self.assertNotEqual(lazy, value)
+        self.assertNotIn(lazy, {value})
+        self.assertNotEqual(lazy, lazy20)
+        self.assertIn(lazy, {str(lazy), lazy20})
+        self.assertIn(str(lazy20), {lazy20})
+
+        legacy = uuid.UUID(int=2 ** 128 - 1)
+        self.assertEqual(LazyShortUUID(legacy), LazyShortUUID20(legacy))
+        self.assertEqual(hash(LazyShortUUID(legacy)), hash(LazyShortUUID20(legacy)))
+
+    def test_json(self):
+        value = uuid.uuid4()
+        lazy = LazyShortUUID(value)
+        expected = json.dumps({'field': shortuuid.encode(value)})
+        self.assertEqual(json.dumps({'field': lazy}, cls=DjangoJSONEncoder), expected)
+        self.assertEqual(json.dumps({'field': lazy}, cls=rest_framework.utils.encoders.JSONEncoder), expected)
+
+    def test_layout(self):
+        # A Promise, for the JSON encoders, which has no __slots__
+        lazy = LazyShortUUID20(uuid.uuid4())
+        self.assertIsInstance(lazy, Promise)
+        self.assertEqual(vars(lazy), {'uuid': lazy.uuid, '_string': None})
+        self.assertNotIn('__slots__', vars(LazyShortUUID))
+        self.assertNotIn('__slots__', vars(LazyShortUUID20))
+
+    def test_20(self):
+        value = native_shortuuid.uuid4_12bits_masked()
+        self.assertEqual(str(LazyShortUUID20(value)), shortuuid.encode(value, pad_length=20))
+        value = uuid.uuid4()
+        self.assertEqual(str(LazyShortUUID20(value)), shortuuid.encode(value))
+
+    def test_deconstruct(self):
+        for field_class in (native_shortuuid.NativeShortUUIDField, native_shortuuid.NativeShortUUID20Field):
+            name, path, args, kwargs = field_class(lazy=True).deconstruct()
+            self.assertEqual(kwargs, {'lazy': True})
+
+
+class TestLazyField(django.test.TestCase):
+    def test_save_load(self):
+        value = shortuuid.uuid()
+        LazyShortUUIDModel.objects.create(field=value)
+        loaded = LazyShortUUIDModel.objects.get()
+        self.assertIsInstance(loaded.field, LazyShortUUID)
+        self.assertIsNone(loaded.field._string)
+        self.assertEqual(native_shortuuid.NativeShortUUIDField(lazy=True).to_python(loaded.field), shortuuid.decode(value))
+
+        loaded.save()
+        self.assertSequenceEqual(LazyShortUUIDModel.objects.filter(field=loaded.field), [loaded])
+        self.assertSequenceEqual(LazyShortUUIDModel.objects.filter(field__in=[loaded.field]), [loaded])
+        self.assertIsNone(loaded.field._string)
+        self.assertEqual(loaded.field, value)
+
+    def test_save_load_20(self):
+        value = shortuuid.encode(native_shortuuid.uuid4_12bits_masked(), pad_length=20)
+        LazyShortUUID20Model.objects.create(field=value)
+        loaded = LazyShortUUID20Model.objects.get()
+        self.assertIsInstance(loaded.field, LazyShortUUID20)
+        self.assertSequenceEqual(LazyShortUUID20Model.objects.filter(field=loaded.field), [loaded])
+        self.assertEqual(loaded.field, value)
+
+
+class TestShortUUIDString(django.test.SimpleTestCase):
+    def test_from_uuid(self):
+        value = uuid.uuid4()
+        string = ShortUUIDString.from_uuid(value)
+        self.assertEqual(string, shortuuid.encode(value))
+        self.assertEqual(string.uuid, value)
+        self.assertEqual(ShortUUIDString.from_uuid20(value), shortuuid.encode(value))
+
+        value = native_shortuuid.uuid4_12bits_masked()
+        self.assertEqual(ShortUUIDString.from_uuid20(value), shortuuid.encode(value, pad_length=20))
+
+    def test_pickle(self):
+        string = ShortUUIDString.from_uuid(uuid.uuid4())
+        loaded = pickle.loads(pickle.dumps(string))
+        self.assertEqual(loaded, string)
+        self.assertEqual(loaded.uuid, string.uuid)
+
+
+@django.test.override_settings(NATIVE_SHORTUUID_KEEP_UUID=True)
+class TestNoDecodeRoundTrip(django.test.TestCase):
+    def assertNotDecoded(self):
+        return mock.patch('native_shortuuid.codec.string_to_int', side_effect=AssertionError('decoded'))
+
+    def test_save_and_filter(self):
+        for model, related_model in (
+            (PrimaryKeyShortUUIDModel, RelatedToShortUUIDModel),
+            (PrimaryKeyShortUUID20Model, RelatedToShortUUID20Model),
+        ):
+            related_model.objects.create(shortuuid_fk=model.objects.create())
+            loaded = model.objects.get()
+            self.assertIsInstance(loaded.pk, ShortUUIDString)
+            with self.assertNotDecoded():
+                loaded.save()
+                self.assertSequenceEqual(model.objects.filter(pk=loaded.pk), [loaded])
+                related = related_model.objects.get(shortuuid_fk=loaded.pk)
+                self.assertSequenceEqual(related_model.objects.filter(shortuuid_fk_id=related.shortuuid_fk_id), [related])
+                related.save()
+
+    def test_disabled_by_default(self):
+        with django.test.override_settings(NATIVE_SHORTUUID_KEEP_UUID=False):
+            PrimaryKeyShortUUIDModel.objects.create()
+            self.assertIs(type(PrimaryKeyShortUUIDModel.objects.get().pk), str)